@@ -1,9 +1,23 @@
 from bpy.types import bpy_prop_collection as _bpy_collection
+from bpy.utils import user_resource as _user_resource
 from codecs import Codec as _Codec, CodecInfo as _CodecInfo, lookup as _lookup
+from functools import cache as _cache
+from hashlib import sha256 as _sha256
 from io import StringIO as _StringIO
 from itertools import chain as _chain, repeat as _repeat
 from json import dumps as _dumps, loads as _loads
+from os import (
+    environ as _environ,
+    makedirs as _makedirs,
+    remove as _remove,
+    replace as _replace,
+    scandir as _scandir,
+    utime as _utime,
+)
+from os.path import join as _join
 from re import MULTILINE as _MULTILINE, compile as _compile
+from shutil import rmtree as _rmtree
+import sys as _sys
 from token import (
     COMMENT as _COMMENT,
     ENDMARKER as _ENDMARKER,
@@ -12,6 +26,8 @@ from token import (
     NEWLINE as _NEWLINE,
     RSQB as _RSQB,
 )
+from tempfile import NamedTemporaryFile as _NamedTempFile
+from time import time as _time
 from tokenize import generate_tokens as _gen_tokens, untokenize as _untokenize
 from typing import (
     ClassVar as _ClassVar,
@@ -20,6 +36,45 @@ from typing import (
     Sequence as _Seq,
 )
 
+# set to a directory to cache decoded source in instead of the user config one
+CACHE_DIRECTORY_ENVIRON = "BCCELERATOR_CODEC_CACHE"
+# bump when the transform changes to invalidate cached output
+_CACHE_VERSION = 1
+# entries not used for this long are pruned, such as those of replaced sources
+_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+# directories of any version, and entries from before there were directories
+_CACHE_ENTRY_NAME = _compile(r"\d+-\d+\.\d+\.\d+|[0-9a-f]{64}\.py|tmp\w+\.tmp", flags=0)
+
+
+def _prune_cache(root: str, current: str):
+    expiry = _time() - _CACHE_MAX_AGE
+    for entry in _scandir(root):
+        if entry.name != current and _CACHE_ENTRY_NAME.fullmatch(entry.name):
+            # entries of other transform or Python versions
+            if entry.is_dir(follow_symlinks=False):
+                _rmtree(entry.path, ignore_errors=True)
+            else:
+                _remove(entry.path)
+    for entry in _scandir(_join(root, current)):
+        if entry.stat(follow_symlinks=False).st_mtime < expiry:
+            _remove(entry.path)
+
+
+@_cache
+def cache_directory():
+    root = _environ.get(CACHE_DIRECTORY_ENVIRON) or _user_resource(
+        "CONFIG", path=_join("bccelerator", "codec"), create=True
+    )
+    # output depends on the tokenizer of the running Python
+    current = "{}-{}.{}.{}".format(_CACHE_VERSION, *_sys.version_info[:3])
+    directory = _join(root, current)
+    _makedirs(directory, exist_ok=True)
+    try:
+        _prune_cache(root, current)
+    except OSError:
+        pass
+    return directory
+
 
 class BcceleratorTransform(_Codec):
     __slots__: _ClassVar = ("__codec",)
@@ -69,6 +124,42 @@ class BcceleratorTransform(_Codec):
         return self.__codec.encode(_untokenize(gen_tokens()), errors=errors)
 
     def decode(self, input: bytes, errors: str = "strict"):
+        key = _sha256(f"{self.__codec.name}:{errors}:".encode())
+        key.update(input)
+        try:
+            directory = cache_directory()
+        except OSError:
+            return self.__decode(input, errors)
+        cache = _join(directory, f"{key.hexdigest()}.py")
+        try:
+            with open(cache, encoding="UTF-8", newline="") as file:
+                ret = file.read(), len(input)
+        except OSError:
+            pass
+        else:
+            try:
+                # keep used entries from being pruned
+                _utime(cache)
+            except OSError:
+                pass
+            return ret
+        ret = self.__decode(input, errors)
+        try:
+            with _NamedTempFile(
+                "w",
+                encoding="UTF-8",
+                newline="",
+                dir=directory,
+                suffix=".tmp",
+                delete=False,
+            ) as file:
+                file.write(ret[0])
+            _replace(file.name, cache)
+        except OSError:
+            pass
+        return ret
+
+    def __decode(self, input: bytes, errors: str):
         inter, consumed = self.__codec.decode(input, errors=errors)
 
         def gen_tokens():
@@ -0,0 +1,215 @@
+# usage: python batch/clean_up.py [--jobs N] [--journal PATH] <file, directory or glob>...
+# each file is cleaned up by its own 'blender --background' process
+from argparse import ArgumentParser as _ArgParser
+from codecs import register as _cdx_reg
+from concurrent.futures import (
+    ThreadPoolExecutor as _ThreadPoolExec,
+    as_completed as _as_completed,
+)
+from glob import glob as _glob
+from importlib import import_module as _import
+from json import dumps as _dumps, loads as _loads
+from os import cpu_count as _cpu_count, walk as _walk
+from os.path import (
+    abspath as _abspath,
+    basename as _basename,
+    dirname as _dirname,
+    isdir as _isdir,
+    join as _join,
+)
+from subprocess import (
+    PIPE as _PIPE,
+    STDOUT as _STDOUT,
+    TimeoutExpired as _TimeoutExpired,
+    run as _run,
+)
+import sys as _sys
+from typing import Any as _Any, Iterable as _Iter, Sequence as _Seq
+
+OPERATORS = (
+    "wm.clean_up_custom_properties",
+    "wm.clean_up_library_weak_reference",
+)
+_RESULT_PREFIX = "bccelerator-batch-result: "
+_REPORT_PREFIXES = ("Info: ", "Warning: ", "Error: ")
+
+
+def _worker(argv: _Seq[str]):
+    # runs inside Blender, with the file to clean up opened
+    from bpy import context as _context, ops as _ops
+
+    root = _dirname(_dirname(_abspath(__file__)))
+    _sys.path.insert(0, _dirname(root))
+    package = _basename(root)
+    _cdx_reg(_import(f"{package}._codec").lookup)
+
+    parser = _ArgParser(prog="clean_up --worker")
+    parser.add_argument("--worker", action="store_true")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--no-backup", action="store_true")
+    args = parser.parse_args(argv)
+
+    main_module = _import(f"{package}.main")
+    main_module.register()
+    try:
+        results = dict[str, list[str]]()
+        for idname in OPERATORS:
+            category, name = idname.split(".")
+            kwargs = (
+                {"mode": "FULL"} if idname == "wm.clean_up_custom_properties" else {}
+            )
+            results[idname] = sorted(getattr(getattr(_ops, category), name)(**kwargs))
+    finally:
+        main_module.unregister()
+    changed = any("FINISHED" in result for result in results.values())
+    if changed and not args.no_save:
+        if args.no_backup:
+            _context.preferences.filepaths.save_version = 0
+        _ops.wm.save_mainfile()  # type: ignore
+    print(
+        _RESULT_PREFIX
+        + _dumps({"operators": results, "saved": changed and not args.no_save}),
+        flush=True,
+    )
+
+
+def _blend_files(patterns: _Iter[str]):
+    seen = set[str]()
+    for pattern in patterns:
+        paths = (
+            (
+                _join(directory, name)
+                for directory, _, names in _walk(pattern)
+                for name in sorted(names)
+                if name.endswith(".blend")
+            )
+            if _isdir(pattern)
+            else sorted(_glob(pattern, recursive=True))
+        )
+        for path in map(_abspath, paths):
+            if path not in seen:
+                seen.add(path)
+                yield path
+
+
+def _load_journal(journal: str):
+    done = dict[str, dict[str, _Any]]()
+    try:
+        with open(journal, encoding="UTF-8") as file:
+            for line in file:
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    # the last line may be cut off by an interruption
+                    continue
+                done[entry["file"]] = entry
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _clean_up(blender: str, path: str, options: _Seq[str], timeout: float | None):
+    entry = dict[str, _Any](file=path)
+    try:
+        process = _run(
+            (
+                blender,
+                "--background",
+                "--factory-startup",
+                path,
+                "--python",
+                _abspath(__file__),
+                "--",
+                "--worker",
+                *options,
+            ),
+            stdout=_PIPE,
+            stderr=_STDOUT,
+            encoding="UTF-8",
+            errors="replace",
+            timeout=timeout,
+        )
+    except OSError as ex:
+        return entry | {"status": "error", "reports": [str(ex)]}
+    except _TimeoutExpired:
+        return entry | {"status": "timeout", "reports": []}
+    reports = list[str]()
+    result = None
+    for line in process.stdout.splitlines():
+        if line.startswith(_RESULT_PREFIX):
+            result = _loads(line[len(_RESULT_PREFIX) :])
+        elif line.startswith(_REPORT_PREFIXES):
+            reports.append(line)
+    if process.returncode or result is None:
+        return entry | {
+            "status": "error",
+            "reports": [
+                *(reports or process.stdout.splitlines()[-10:]),
+                f"Exited with code {process.returncode}",
+            ],
+        }
+    return entry | {"status": "done", "reports": reports} | result
+
+
+def main(argv: _Seq[str]):
+    parser = _ArgParser(prog="clean_up")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--blender", default="blender")
+    parser.add_argument("--jobs", type=int, default=_cpu_count() or 1)
+    parser.add_argument("--journal", default="bccelerator-clean-up.jsonl")
+    parser.add_argument("--timeout", type=float, default=None)
+    parser.add_argument("--retry-errors", action="store_true")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--no-backup", action="store_true")
+    args = parser.parse_args(argv)
+    options = tuple(
+        option
+        for option, enabled in (
+            ("--no-save", args.no_save),
+            ("--no-backup", args.no_backup),
+        )
+        if enabled
+    )
+
+    # files in the journal were finished by a previous, possibly interrupted, run
+    done = _load_journal(args.journal)
+    paths = [
+        path
+        for path in _blend_files(args.paths)
+        if path not in done or (args.retry_errors and done[path]["status"] != "done")
+    ]
+    print(f"{len(paths)} file(s) to clean up, {len(done)} in journal", flush=True)
+
+    statuses = dict[str, int]()
+    # threads only wait for the Blender processes, which do the work
+    with (
+        open(args.journal, "a", encoding="UTF-8") as journal,
+        _ThreadPoolExec(max_workers=max(args.jobs, 1)) as executor,
+    ):
+        futures = (
+            executor.submit(_clean_up, args.blender, path, options, args.timeout)
+            for path in paths
+        )
+        for index, future in enumerate(_as_completed(tuple(futures)), 1):
+            entry = future.result()
+            journal.write(_dumps(entry) + "\n")
+            journal.flush()
+            status = entry["status"]
+            statuses[status] = statuses.get(status, 0) + 1
+            print(f"[{index}/{len(paths)}] {status}: {entry['file']}", flush=True)
+            for report in entry["reports"]:
+                print(f"    {report}", flush=True)
+    print(
+        ", ".join(f"{count} {status}" for status, count in sorted(statuses.items()))
+        or "nothing to do"
+    )
+    if statuses.keys() - {"done"}:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    argv = _sys.argv[_sys.argv.index("--") + 1 :] if "--" in _sys.argv else []
+    if "--worker" in argv:
+        _worker(argv)
+    else:
+        main(_sys.argv[1:])
@@ -0,0 +1 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
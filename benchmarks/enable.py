@@ -0,0 +1,86 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+from argparse import ArgumentParser as _ArgParser
+from bpy import app as _app
+from bpy.app import timers as _app_timers
+from importlib import import_module as _import
+from os import environ as _environ
+import sys as _sys
+from tempfile import TemporaryDirectory as _TempDir
+from time import perf_counter as _perf_counter
+from typing import Sequence as _Seq
+
+from .._codec import (
+    CACHE_DIRECTORY_ENVIRON as _CACHE_DIRECTORY_ENVIRON,
+    cache_directory as _cache_directory,
+)
+from ..main import LAZY_REGISTER_ENVIRON as _LAZY_REGISTER_ENVIRON
+
+_PACKAGE = __package__.rpartition(".")[0]
+
+
+def _enable():
+    # what the add-on imports and registers, excluding the codec itself, until
+    # 'register' returns and until every tool module is registered
+    for name in tuple(_sys.modules):
+        if name.startswith((f"{_PACKAGE}.core", f"{_PACKAGE}.main")):
+            del _sys.modules[name]
+    start = _perf_counter()
+    main = _import(f"{_PACKAGE}.main")
+    main.register()
+    enabled = _perf_counter() - start
+    if _app_timers.is_registered(main._register_all):
+        # the work deferred to the timer, done here instead of after the script
+        _app_timers.unregister(main._register_all)
+        main._register_all()
+    registered = _perf_counter() - start
+    main.unregister()
+    return enabled, registered
+
+
+def main(argv: _Seq[str]):
+    parser = _ArgParser(prog="enable")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--lazy", action="store_true")
+    args = parser.parse_args(argv)
+    if args.lazy:
+        if _app.background:
+            raise SystemExit(
+                "--lazy needs a UI session, as it is ignored in background"
+            )
+        # lazy registration defers the work to after enabling rather than removing it,
+        # so the time until every tool module is registered is reported too
+        _environ[_LAZY_REGISTER_ENVIRON] = "1"
+
+    # compile every module from source, as after an upgrade, with an empty codec
+    # cache for each cold run, leaving the cache of the user untouched
+    dont_write_bytecode, pycache_prefix = _sys.dont_write_bytecode, _sys.pycache_prefix
+    codec_cache = _environ.get(_CACHE_DIRECTORY_ENVIRON)
+    with _TempDir() as pycache:
+        _sys.dont_write_bytecode, _sys.pycache_prefix = True, pycache
+        try:
+            print(
+                f"{'run':>5} {'cold (s)':>12} {'warm (s)':>12}"
+                + (f" {'cold all (s)':>12} {'warm all (s)':>12}" if args.lazy else "")
+            )
+            for run in range(args.repeat):
+                with _TempDir() as directory:
+                    _environ[_CACHE_DIRECTORY_ENVIRON] = directory
+                    _cache_directory.cache_clear()
+                    cold, cold_all = _enable()
+                    warm, warm_all = _enable()
+                print(
+                    f"{run:>5} {cold:>12.3f} {warm:>12.3f}"
+                    + (f" {cold_all:>12.3f} {warm_all:>12.3f}" if args.lazy else "")
+                )
+        finally:
+            if args.lazy:
+                _environ.pop(_LAZY_REGISTER_ENVIRON, None)
+            _sys.dont_write_bytecode, _sys.pycache_prefix = (
+                dont_write_bytecode,
+                pycache_prefix,
+            )
+            if codec_cache is None:
+                _environ.pop(_CACHE_DIRECTORY_ENVIRON, None)
+            else:
+                _environ[_CACHE_DIRECTORY_ENVIRON] = codec_cache
+            _cache_directory.cache_clear()
@@ -0,0 +1,82 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+from argparse import ArgumentParser as _ArgParser
+from itertools import islice as _islice
+from math import log10 as _log10
+from random import Random as _Random
+from time import perf_counter as _perf_counter
+import numpy as _np
+from typing import Any as _Any, Callable as _Callable, Sequence as _Seq
+
+from ..core.utils.mesh import find_doubles as _find_doubles
+
+_TOLERANCE = 0.0001
+_SIZES = (10_000, 100_000, 1_000_000)
+
+_Vec3 = tuple[float, float, float]
+
+
+def _synthetic_centers(faces: int, *, doubles: float, seed: int) -> list[_Vec3]:
+    # a flat grid of unit faces, a fraction of which is doubled within tolerance
+    rng = _Random(seed)
+    side = max(1, round(faces**0.5))
+    centers = list[_Vec3]()
+    while len(centers) < faces:
+        index = len(centers)
+        center = (index % side + 0.5, index // side + 0.5, 0.0)
+        centers.append(center)
+        if rng.random() < doubles and len(centers) < faces:
+            jitter = _TOLERANCE * 0.9
+            centers.append(
+                (
+                    center[0] + rng.uniform(-jitter, jitter),
+                    center[1] + rng.uniform(-jitter, jitter),
+                    center[2],
+                )
+            )
+    return centers
+
+
+def _legacy_find_doubles(points: _Seq[_Vec3], tolerance: float) -> set[int]:
+    rounding = round(-_log10(tolerance) + 1)
+    faces = list(enumerate(points))
+    for axis in range(3):
+        faces.sort(key=lambda face: round(face[1][axis], rounding))
+    doubles = set[int]()
+    for index, (face, vec) in _islice(enumerate(faces), 1, None):
+        prev_face, prev_vec = faces[index - 1]
+        if all(abs(prev_vec[axis] - vec[axis]) < tolerance for axis in range(3)):
+            doubles.add(face)
+            doubles.add(prev_face)
+    return doubles
+
+
+def _time(func: _Callable[[], _Any]):
+    start = _perf_counter()
+    result = func()
+    return _perf_counter() - start, result
+
+
+def main(argv: _Seq[str]):
+    parser = _ArgParser(prog="face_doubles")
+    parser.add_argument("--sizes", type=int, nargs="+", default=_SIZES)
+    parser.add_argument("--doubles", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory-limit", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'faces':>10} {'legacy (s)':>12} {'found':>8} {'grid (s)':>12} {'found':>8}"
+        f" {'limited (s)':>12} {'same':>5}"
+    )
+    for size in args.sizes:
+        centers = _synthetic_centers(size, doubles=args.doubles, seed=args.seed)
+        legacy_time, legacy = _time(lambda: _legacy_find_doubles(centers, _TOLERANCE))
+        array = _np.array(centers, dtype=_np.float64)
+        grid_time, grid = _time(lambda: _find_doubles(array, _TOLERANCE))
+        limited_time, limited = _time(
+            lambda: _find_doubles(array, _TOLERANCE, memory_limit=args.memory_limit)
+        )
+        print(
+            f"{size:>10} {legacy_time:>12.3f} {len(legacy):>8} {grid_time:>12.3f} {int(grid.sum()):>8}"
+            f" {limited_time:>12.3f} {str((grid == limited).all()):>5}"
+        )
@@ -0,0 +1,160 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+# sound strips and transitions need an NLA editor, so tracks are clip only when
+# run with --background, and also have transitions in a UI session
+from argparse import ArgumentParser as _ArgParser
+from bpy import context as _context, data as _data, ops as _ops
+from bpy.types import NlaTrack as _NlaTrack, Object as _Obj
+from time import perf_counter as _perf_counter
+from typing import Any as _Any, Callable as _Callable, Sequence as _Seq
+
+from ..core.utils import copy_attrs as _copy_attrs
+
+_SIZES = (10, 50, 200)
+_OBJECTS = 50
+_NLA_COPY_SELECTED_TRACK = _ops.nla.copy_selected_track  # type: ignore
+_NLA_SELECT_ALL = _ops.nla.select_all  # type: ignore
+_NLA_SOUNDCLIP_ADD = _ops.nla.soundclip_add  # type: ignore
+_NLA_TRANSITION_ADD = _ops.nla.transition_add  # type: ignore
+# strip attributes copied by the previous implementation
+_LEGACY_STRIP_ATTRS = (
+    "action",
+    "action_frame_end",
+    "action_frame_start",
+    "blend_in",
+    "blend_out",
+    "blend_type",
+    "extrapolation",
+    "frame_end",
+    "frame_start",
+    "influence",
+    "mute",
+    "name",
+    "repeat",
+    "scale",
+    "strip_time",
+    "use_animated_influence",
+    "use_animated_time",
+    "use_animated_time_cyclic",
+    "use_auto_blend",
+    "use_reverse",
+    "use_sync_length",
+)
+
+
+def _synthetic_track(strips: int, *, transitions: bool) -> _NlaTrack:
+    action = _data.actions.new("")
+    keyframes = action.fcurves.new("location", index=0).keyframe_points
+    keyframes.insert(0, 0)
+    keyframes.insert(5, 1)
+    source = _data.objects.new("", object_data=None)
+    _context.scene.collection.objects.link(source)
+    source.select_set(True)
+    track = source.animation_data_create().nla_tracks.new()
+    for index in range(strips):
+        track.strips.new(str(index), index * 10, action).influence = 0.5
+    if transitions:
+        # one transition in every gap between the strips
+        _NLA_SELECT_ALL(action="DESELECT")
+        for strip in track.strips:
+            strip.select = True
+        _NLA_TRANSITION_ADD()
+        _NLA_SELECT_ALL(action="DESELECT")
+    return track
+
+
+def _legacy_copy(from_track: _NlaTrack, objects: _Seq[_Obj]):
+    # the previous implementation, with operator calls for each sound strip and
+    # transition, and strip attributes read again for every object
+    scene = _context.scene
+    for obj in objects:
+        to_track = obj.animation_data.nla_tracks.new()
+        _copy_attrs(to_track, ("lock", "mute", "name"), from_track)
+        current_frame = scene.frame_current
+        lock = to_track.lock
+        try:
+            to_track.lock = False
+            transitions = list[int]()
+            for index, strip in enumerate(from_track.strips):
+                if strip.type == "TRANSITION":
+                    transitions.append(index)
+                elif strip.type == "CLIP":
+                    _copy_attrs(
+                        to_track.strips.new(
+                            strip.name, int(strip.frame_start), strip.action
+                        ),
+                        _LEGACY_STRIP_ATTRS,
+                        strip,
+                    )
+                elif strip.type == "SOUND":
+                    scene.frame_current = int(strip.frame_start)
+                    _NLA_SOUNDCLIP_ADD()
+                    _copy_attrs(to_track.strips[-1], _LEGACY_STRIP_ATTRS, strip)
+            for transition in transitions:
+                trans_from = to_track.strips[transition - 1]
+                trans_to = to_track.strips[transition]
+                _NLA_SELECT_ALL(action="DESELECT")
+                trans_from.select = trans_to.select = True
+                _NLA_TRANSITION_ADD()
+                trans_from.select = trans_to.select = False
+        finally:
+            to_track.lock = lock
+            scene.frame_current = current_frame
+
+
+def _operator_copy(from_track: _NlaTrack, objects: _Seq[_Obj]):
+    with _context.temp_override(
+        active_nla_track=from_track,
+        selected_objects=[from_track.id_data, *objects],
+    ):
+        _NLA_COPY_SELECTED_TRACK()
+
+
+def _time(
+    func: _Callable[[_NlaTrack, _Seq[_Obj]], None],
+    from_track: _NlaTrack,
+    objects: _Seq[_Obj],
+):
+    for obj in objects:
+        obj.animation_data_clear()
+        obj.animation_data_create()
+    start = _perf_counter()
+    func(from_track, objects)
+    ret = _perf_counter() - start
+    strips = len(from_track.strips)
+    if any(len(obj.animation_data.nla_tracks[0].strips) != strips for obj in objects):
+        raise SystemExit(f"{func.__name__} did not copy every strip")
+    return ret
+
+
+def main(argv: _Seq[str]):
+    parser = _ArgParser(prog="nla_copy")
+    parser.add_argument("--sizes", type=int, nargs="+", default=_SIZES)
+    parser.add_argument("--objects", type=int, default=_OBJECTS)
+    args = parser.parse_args(argv)
+
+    override = dict[str, _Any]()
+    window = _context.window
+    if window is not None:
+        area = window.screen.areas[0]
+        area.type = "NLA_EDITOR"
+        override.update(
+            window=window,
+            area=area,
+            region=next(region for region in area.regions if region.type == "WINDOW"),
+        )
+    with _context.temp_override(**override):
+        objects = tuple(
+            _data.objects.new("", object_data=None) for _ in range(args.objects)
+        )
+        for obj in objects:
+            _context.scene.collection.objects.link(obj)
+            obj.select_set(True)
+        print(f"{'strips':>10} {'objects':>8} {'legacy (s)':>12} {'operator (s)':>12}")
+        for size in args.sizes:
+            track = _synthetic_track(size, transitions=window is not None)
+            legacy_time = _time(_legacy_copy, track, objects)
+            operator_time = _time(_operator_copy, track, objects)
+            print(
+                f"{len(track.strips):>10} {len(objects):>8} {legacy_time:>12.3f} {operator_time:>12.3f}"
+            )
+            _data.objects.remove(track.id_data)
@@ -0,0 +1,79 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+# usage: blender --factory-startup --python benchmarks/run.py -- nla_fmodifier
+# (without --background, as F-modifiers of NLA strips are only added by an
+# operator that needs an NLA editor)
+from argparse import ArgumentParser as _ArgParser
+from bpy import context as _context, data as _data, ops as _ops
+from bpy.types import NlaTrack as _NlaTrack
+from time import perf_counter as _perf_counter
+from typing import Callable as _Callable, Sequence as _Seq
+
+_SIZES = (1000, 2000)
+_NLA_FMODIFIER_ADD = _ops.nla.fmodifier_add  # type: ignore
+_NLA_SELECT_ALL = _ops.nla.select_all  # type: ignore
+_NLA_SYNCHRONIZE = _ops.nla.sychronize_stepped_interpolation_fmodifier  # type: ignore
+
+
+def _synthetic_track(strips: int) -> _NlaTrack:
+    action = _data.actions.new("")
+    keyframes = action.fcurves.new("location", index=0).keyframe_points
+    keyframes.insert(0, 0)
+    keyframes.insert(5, 1)
+    obj = _data.objects.new("", object_data=None)
+    _context.scene.collection.objects.link(obj)
+    obj.select_set(True)
+    track = obj.animation_data_create().nla_tracks.new()
+    for index in range(strips):
+        track.strips.new(str(index), index * 10, action)
+    return track
+
+
+def _per_strip_add(track: _NlaTrack):
+    # the previous implementation, with one operator call per strip
+    strips = tuple(track.strips)
+    _NLA_SELECT_ALL(action="DESELECT")
+    for strip in strips:
+        strip.select = True
+        _NLA_FMODIFIER_ADD(type="STEPPED", only_active=False)
+        strip.select = False
+    for strip in strips:
+        strip.select = True
+
+
+def _synchronize(track: _NlaTrack):
+    _NLA_SYNCHRONIZE(select="ALWAYS_ADD")
+
+
+def _time(func: _Callable[[_NlaTrack], None], size: int):
+    track = _synthetic_track(size)
+    for strip in track.strips:
+        strip.select = True
+    start = _perf_counter()
+    func(track)
+    ret = _perf_counter() - start
+    if any(len(strip.modifiers) != 1 for strip in track.strips):
+        raise SystemExit(
+            "F-modifiers not added to every strip, is the NLA editor visible?"
+        )
+    _data.objects.remove(track.id_data)
+    return ret
+
+
+def main(argv: _Seq[str]):
+    parser = _ArgParser(prog="nla_fmodifier")
+    parser.add_argument("--sizes", type=int, nargs="+", default=_SIZES)
+    args = parser.parse_args(argv)
+
+    window = _context.window
+    if window is None:
+        raise SystemExit("needs a window, run without --background")
+    area = window.screen.areas[0]
+    area.type = "NLA_EDITOR"
+    region = next(region for region in area.regions if region.type == "WINDOW")
+
+    print(f"{'strips':>10} {'per strip (s)':>14} {'operator (s)':>14}")
+    with _context.temp_override(window=window, area=area, region=region):
+        for size in args.sizes:
+            per_strip_time = _time(_per_strip_add, size)
+            operator_time = _time(_synchronize, size)
+            print(f"{size:>10} {per_strip_time:>14.3f} {operator_time:>14.3f}")
@@ -0,0 +1,315 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+from argparse import ArgumentParser as _ArgParser
+from bpy import context as _context, data as _data, ops as _ops
+from bpy.types import Mesh as _Mesh, Object as _Obj
+from dataclasses import dataclass as _dataclass
+from functools import cache as _cache
+from importlib import import_module as _import
+from json import dump as _dump, load as _load
+from os.path import join as _join
+from tempfile import TemporaryDirectory as _TempDir
+from time import perf_counter as _perf_counter
+from tracemalloc import (
+    get_traced_memory as _get_traced_memory,
+    start as _tracemalloc_start,
+    stop as _tracemalloc_stop,
+)
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Mapping as _Map,
+    Sequence as _Seq,
+    final as _final,
+)
+
+_PACKAGE = __package__.rpartition(".")[0]
+_WM_APPEND = _ops.wm.append  # type: ignore
+_WM_READ_FACTORY_SETTINGS = _ops.wm.read_factory_settings  # type: ignore
+
+
+@_final
+@_dataclass(
+    init=True,
+    repr=True,
+    eq=True,
+    order=False,
+    unsafe_hash=False,
+    frozen=True,
+    match_args=True,
+    kw_only=True,
+    slots=True,
+)
+class _Case:
+    setup: _Callable[[int], _Map[str, _Any]]
+    scales: _Seq[int]
+    kwargs: _Map[str, _Any]
+
+
+def _grid_mesh(name: str, side: int) -> _Mesh:
+    mesh = _data.meshes.new(name)
+    mesh.from_pydata(
+        [(x, y, 0.0) for y in range(side + 1) for x in range(side + 1)],
+        [],
+        [
+            (
+                y * (side + 1) + x,
+                y * (side + 1) + x + 1,
+                (y + 1) * (side + 1) + x + 1,
+                (y + 1) * (side + 1) + x,
+            )
+            for y in range(side)
+            for x in range(side)
+        ],
+    )
+    return mesh
+
+
+def _objects(count: int, *, object_data: _Any = None) -> list[_Obj]:
+    objects = [_data.objects.new(str(index), object_data) for index in range(count)]
+    for obj in objects:
+        _context.scene.collection.objects.link(obj)
+    return objects
+
+
+def _nla_track(obj: _Obj, strips: int):
+    action = _data.actions.new("")
+    keyframes = action.fcurves.new("location", index=0).keyframe_points
+    keyframes.insert(0, 0)
+    keyframes.insert(5, 1)
+    track = obj.animation_data_create().nla_tracks.new()
+    for index in range(strips):
+        track.strips.new(str(index), index * 10, action)
+    _context.scene.frame_end = strips * 10
+    return track
+
+
+def _setup_merge_wall_collection(walls: int, *, name: str = "wall"):
+    # every other wall is doubled, so that its faces are removed
+    collection = _data.collections.new(name)
+    _context.scene.collection.children.link(collection)
+    for index in range(walls):
+        obj = _data.objects.new(str(index), _grid_mesh(str(index), 10))
+        obj.location.x = index // 2 * 20
+        collection.objects.link(obj)
+    return {"collection": collection}
+
+
+def _setup_merge_wall_collections(collections: int):
+    for index in range(collections):
+        _setup_merge_wall_collection(100, name=f"wall{index}")
+    return {}
+
+
+def _setup_clean_up_custom_properties(objects: int):
+    for index, obj in enumerate(_objects(objects)):
+        obj["ant_landscape" if index % 2 else "unrelated"] = 0
+    return {}
+
+
+def _setup_configure_eevee_volumetrics(objects: int):
+    return {"selected_objects": _objects(objects)}
+
+
+def _setup_fix_rigify_rig_animation_data(drivers: int):
+    mesh = _data.meshes.new("")
+    (rig,) = _objects(1, object_data=mesh)
+    rig["rig_ui"] = 0
+    for index in range(drivers):
+        mesh[f"prop{index}"] = 0.0
+        variable = mesh.driver_add(f'["prop{index}"]').driver.variables.new()
+        variable.targets[0].id = rig
+    return {"selected_objects": [rig]}
+
+
+def _setup_copy_selected_nla_track(strips: int):
+    source, *targets = _objects(11)
+    return {
+        "active_nla_track": _nla_track(source, strips),
+        "selected_objects": [source, *targets],
+    }
+
+
+def _setup_randomize_selected_nla_strip(strips: int):
+    (obj,) = _objects(1)
+    track = _nla_track(obj, strips)
+    return {"selected_nla_strips": list(track.strips)[::2]}
+
+
+def _setup_link_modifier_by_name(objects: int):
+    active, *selected = _objects(objects + 1, object_data=_grid_mesh("", 1))
+    for obj in (active, *selected):
+        obj.modifiers.new("Array", "ARRAY")
+    active.modifiers.active = active.modifiers["Array"]
+    return {"active_object": active, "selected_objects": [active, *selected]}
+
+
+@_cache
+def _library_directory():
+    # removed when the benchmark exits
+    return _TempDir()
+
+
+def _setup_clean_up_library_weak_reference(objects: int):
+    # appending with local data reuse records the library of each data-block in
+    # its weak reference
+    filepath = _join(_library_directory().name, f"library{objects}.blend")
+    _data.libraries.write(filepath, set(_objects(objects)))
+    _data.batch_remove(tuple(_data.objects))
+    _WM_APPEND(
+        directory=_join(filepath, "Object", ""),
+        files=[{"name": str(index)} for index in range(objects)],
+        do_reuse_local_id=True,
+    )
+    if sum(bool(obj.library_weak_reference) for obj in _data.objects) != objects:
+        raise SystemExit("appended objects have no library weak references")
+    return {}
+
+
+_CASES = {
+    "object.merge_wall_collection": _Case(
+        setup=_setup_merge_wall_collection, scales=(10, 100, 1000), kwargs={}
+    ),
+    "object.merge_wall_collections": _Case(
+        setup=_setup_merge_wall_collections, scales=(1, 10, 100), kwargs={}
+    ),
+    "wm.clean_up_custom_properties": _Case(
+        setup=_setup_clean_up_custom_properties,
+        scales=(100, 1000, 10000),
+        kwargs={},
+    ),
+    "object.configure_eevee_volumetrics": _Case(
+        setup=_setup_configure_eevee_volumetrics,
+        scales=(100, 1000, 10000),
+        kwargs={"mode": "ENABLE"},
+    ),
+    "rigify.fix_animation_data": _Case(
+        setup=_setup_fix_rigify_rig_animation_data,
+        scales=(10, 100, 1000),
+        kwargs={},
+    ),
+    "nla.copy_selected_track": _Case(
+        setup=_setup_copy_selected_nla_track, scales=(10, 100, 1000), kwargs={}
+    ),
+    "nla.randomize_selected_strip": _Case(
+        setup=_setup_randomize_selected_nla_strip,
+        scales=(10, 100, 1000),
+        kwargs={},
+    ),
+    "object.link_modifier_by_name": _Case(
+        setup=_setup_link_modifier_by_name, scales=(10, 100, 1000), kwargs={}
+    ),
+    "wm.clean_up_library_weak_reference": _Case(
+        setup=_setup_clean_up_library_weak_reference,
+        scales=(100, 1000, 10000),
+        kwargs={},
+    ),
+}
+# operators that need an editor, which does not exist in the background, and tools
+_SKIPPED = {
+    "wm.bccelerator_profile_dump": "is a profiling tool",
+    "wm.bccelerator_profile_toggle": "is a profiling tool",
+    "nla.sychronize_stepped_interpolation_fmodifier": "needs the NLA editor, see nla_fmodifier",
+    "object.remap_user_to_library_by_name": "needs the outliner",
+    "object.remap_user_to_local_by_name": "needs the outliner",
+    "outliner.localize_library": "needs the outliner",
+    "outliner.liboverride_editable_operation": "needs the outliner",
+    "node.make_links_by_name": "needs the node editor",
+    "node.configure_principled_material_driver": "needs the node editor",
+}
+
+
+def _run(idname: str, case: _Case, scale: int) -> dict[str, _Any]:
+    _WM_READ_FACTORY_SETTINGS(use_empty=True)
+    override = case.setup(scale)
+    category, name = idname.split(".")
+    operator = getattr(getattr(_ops, category), name)
+
+    # count operator calls made while the operator runs, including itself
+    op_call = getattr(_ops, "_op_call")
+    calls = 0
+
+    def counted_op_call(*args: _Any):
+        nonlocal calls
+        calls += 1
+        return op_call(*args)
+
+    setattr(_ops, "_op_call", counted_op_call)
+    _tracemalloc_start()
+    try:
+        with _context.temp_override(**override):
+            start = _perf_counter()
+            try:
+                result = sorted(operator(**case.kwargs))
+            except RuntimeError as ex:
+                result = str(ex)
+            time = _perf_counter() - start
+        _, peak = _get_traced_memory()
+    finally:
+        _tracemalloc_stop()
+        setattr(_ops, "_op_call", op_call)
+    return {"time": time, "peak": peak, "calls": calls - 1, "result": result}
+
+
+def _compare(
+    results: _Map[str, _Map[str, _Any]],
+    baseline: _Map[str, _Map[str, _Any]],
+    threshold: float,
+):
+    regressions = 0
+    for key, result in results.items():
+        try:
+            base = baseline[key]
+        except KeyError:
+            continue
+        for metric in ("time", "peak", "calls"):
+            if result[metric] > base[metric] * (1 + threshold):
+                regressions += 1
+                print(f"REGRESSION {key} {metric}: {base[metric]} -> {result[metric]}")
+    return regressions
+
+
+def main(argv: _Seq[str]):
+    parser = _ArgParser(prog="operators")
+    parser.add_argument("--operators", nargs="+", default=tuple(_CASES))
+    parser.add_argument("--max-scale", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    main_module = _import(f"{_PACKAGE}.main")
+    main_module.register()
+    try:
+        results = dict[str, dict[str, _Any]]()
+        print(
+            f"{'operator':<48} {'scale':>6} {'time (s)':>10} {'peak':>12} {'calls':>6}"
+        )
+        for idname in args.operators:
+            if idname in _SKIPPED:
+                print(f"{idname:<48} skipped: {_SKIPPED[idname]}")
+                continue
+            case = _CASES[idname]
+            for scale in case.scales:
+                if args.max_scale is not None and scale > args.max_scale:
+                    continue
+                # keep the fastest run, which is the least disturbed one
+                result = min(
+                    (_run(idname, case, scale) for _ in range(args.repeat)),
+                    key=lambda result: result["time"],
+                )
+                results[f"{idname}@{scale}"] = result
+                print(
+                    f"{idname:<48} {scale:>6} {result['time']:>10.3f} {result['peak']:>12} {result['calls']:>6}"
+                )
+    finally:
+        main_module.unregister()
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="UTF-8") as file:
+            _dump({"results": results, "skipped": _SKIPPED}, file, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline, encoding="UTF-8") as file:
+            baseline = _load(file)["results"]
+        if _compare(results, baseline, args.threshold):
+            raise SystemExit(1)
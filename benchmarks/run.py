@@ -0,0 +1,21 @@
+# usage: blender --background --factory-startup --python benchmarks/run.py -- <suite> [args...]
+from codecs import register as _cdx_reg
+from importlib import import_module as _import
+from os.path import abspath as _abspath, basename as _basename, dirname as _dirname
+import sys as _sys
+
+
+def main():
+    root = _dirname(_dirname(_abspath(__file__)))
+    _sys.path.insert(0, _dirname(root))
+    package = _basename(root)
+    _cdx_reg(_import(f"{package}._codec").lookup)
+
+    argv = _sys.argv[_sys.argv.index("--") + 1 :] if "--" in _sys.argv else []
+    if not argv:
+        raise SystemExit("missing benchmark suite name")
+    _import(f"{package}.benchmarks.{argv[0]}").main(argv[1:])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,14 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
-def items():
-    from . import animation
-
-    yield animation
-    from . import library
+from importlib import import_module as _import
+from pkgutil import iter_modules as _iter_modules
+from types import ModuleType as _ModuleType
 
-    yield library
-    from . import link
 
-    yield link
-    from . import node
+def item(name: str) -> _ModuleType:
+    return _import(f".{name}", __package__)
 
-    yield node
-    from . import object
 
-    yield object
+def items():
+    # every module of this package is a tool module, in name order
+    for module in _iter_modules(__path__):
+        yield item(module.name)
@@ -1,6 +1,7 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
 from bpy.ops import nla as _nla
 from bpy.props import (
+    BoolProperty as _BoolProp,  # type: ignore
     EnumProperty as _EnumProp,  # type: ignore
     FloatProperty as _FloatProp,  # type: ignore
     IntProperty as _IntProp,  # type: ignore
@@ -8,6 +9,7 @@ from bpy.props import (
 from bpy.types import (
     Context as _Ctx,
     Event as _Evt,
+    FModifier as _FMod,
     FModifierStepped as _FModStepped,
     ID as _ID,
     NlaStrip as _NlaStrip,
@@ -15,10 +17,21 @@ from bpy.types import (
     Object as _Obj,
     Operator as _Op,
 )
-from random import randint as _randint
-from typing import Annotated as _Annotated, ClassVar as _ClassVar, cast as _cast
+from itertools import islice as _islice
+from random import Random as _Random
+from typing import (
+    Annotated as _Annotated,
+    ClassVar as _ClassVar,
+    Iterable as _Iter,
+    Sequence as _Seq,
+    cast as _cast,
+)
 
-from ..utils import copy_attrs as _copy_attrs
+from ..utils import (
+    copy_attrs as _copy_attrs,
+    get_attrs as _get_attrs,
+    set_attrs as _set_attrs,
+)
 from ..utils.enums import (
     FModifierType as _FModType,
     NLAStrip as _ENLAStrip,
@@ -28,6 +41,7 @@ from ..utils.enums import (
     WMReport as _WMReport,
 )
 from ..utils.props import enum_property_item as _enum_prop_item
+from ..utils.report import Reporter as _Reporter
 from ..utils.types import (
     Drawer as _Drawer,
     draw_func_class as _draw_func_class,
@@ -44,42 +58,37 @@ _NLA_SOUNDCLIP_ADD = _nla.soundclip_add  # type: ignore
 _NLA_TRANSITION_ADD = _nla.transition_add  # type: ignore
 
 
-def _copy_nla_strip(to_strip: _NlaStrip, from_strip: _NlaStrip):
-    _copy_attrs(
-        to_strip,
-        (
-            "action",
-            "action_frame_end",
-            "action_frame_start",
-            # 'active',
-            "blend_in",
-            "blend_out",
-            "blend_type",
-            "extrapolation",
-            # 'fcurves',
-            "frame_end",
-            # 'frame_end_ui',
-            "frame_start",
-            # 'frame_start_ui',
-            "influence",
-            # 'modifiers',
-            "mute",
-            "name",
-            "repeat",
-            "scale",
-            # 'select',
-            "strip_time",
-            # 'strips',
-            # 'type',
-            "use_animated_influence",
-            "use_animated_time",
-            "use_animated_time_cyclic",
-            "use_auto_blend",
-            "use_reverse",
-            "use_sync_length",
-        ),
-        from_strip,
-    )
+_NLA_STRIP_ATTRS = (
+    "action",
+    "action_frame_end",
+    "action_frame_start",
+    # 'active',
+    "blend_in",
+    "blend_out",
+    "blend_type",
+    "extrapolation",
+    # 'fcurves',
+    "frame_end",
+    # 'frame_end_ui',
+    "frame_start",
+    # 'frame_start_ui',
+    "influence",
+    # 'modifiers',
+    "mute",
+    "name",
+    "repeat",
+    "scale",
+    # 'select',
+    "strip_time",
+    # 'strips',
+    # 'type',
+    "use_animated_influence",
+    "use_animated_time",
+    "use_animated_time_cyclic",
+    "use_auto_blend",
+    "use_reverse",
+    "use_sync_length",
+)
 
 
 def _copy_nla_track(to_track: _NlaTrack, from_track: _NlaTrack):
@@ -99,6 +108,41 @@ def _copy_nla_track(to_track: _NlaTrack, from_track: _NlaTrack):
     )
 
 
+def _stepped_fmodifier(mods: _Seq[_FMod], index: int) -> _FModStepped | None:
+    # the 'index'-th stepped F-modifier, without collecting all of them
+    stepped = (
+        _cast(_FModStepped, mod)
+        for mod in (reversed(mods) if index < 0 else mods)
+        if mod.type == _FModType.STEPPED
+    )
+    return next(_islice(stepped, ~index if index < 0 else index, None), None)
+
+
+def _add_nla_transitions(strips: _Seq[_NlaStrip], transitions: _Iter[int]):
+    # no data API for transitions, but one operator call adds a transition between
+    # every pair of adjacent selected strips, so add each run of transitions at once,
+    # using another call for a run next to the previous one
+    batches = (list[_NlaStrip](), list[_NlaStrip]())
+    batch, run_end = 0, -2
+    for index in sorted(set(transitions)):
+        if index > len(strips) - 1:
+            break
+        if index != run_end + 1:
+            if index == run_end + 2:
+                batch ^= 1
+            batches[batch].append(strips[index - 1])
+        batches[batch].append(strips[index])
+        run_end = index
+    for selection in batches:
+        if selection:
+            _NLA_SELECT_ALL(action="DESELECT")
+            for strip in selection:
+                strip.select = True
+            _NLA_TRANSITION_ADD()
+            for strip in selection:
+                strip.select = False
+
+
 class CopySelectedNLATrack(_Op):
     """Copy selected NLA track(s) to selected object(s)"""
 
@@ -127,6 +171,10 @@ class CopySelectedNLATrack(_Op):
     ) -> set[str]:
         processed = 0
         from_track = context.active_nla_track
+        # read once, paste to every object
+        from_strips = tuple(
+            (strip, _get_attrs(strip, _NLA_STRIP_ATTRS)) for strip in from_track.strips
+        )
         for obj in context.selected_objects:
             if obj is not _cast(_Obj, from_track.id_data):
                 to_track = _ensure_anim_d(obj).nla_tracks.new()
@@ -137,34 +185,31 @@ class CopySelectedNLATrack(_Op):
                 try:
                     to_track.lock = False
 
+                    to_strips = list[_NlaStrip]()
                     transitions = list[int]()
-                    for index, strip in enumerate(from_track.strips):
+                    for strip, values in from_strips:
                         if strip.type == _ENLAStrip.Type.TRANSITION:
-                            transitions.append(index)
+                            if to_strips:
+                                transitions.append(len(to_strips))
+                            continue
                         elif strip.type == _ENLAStrip.Type.CLIP:
-                            _copy_nla_strip(
-                                to_track.strips.new(
-                                    strip.name, int(strip.frame_start), strip.action
-                                ),
-                                strip,
+                            new_strip = to_track.strips.new(
+                                strip.name, int(strip.frame_start), strip.action
                             )
                         elif strip.type == _ENLAStrip.Type.SOUND:
+                            # no data API for sound strips
                             context.scene.frame_current = int(strip.frame_start)
                             _NLA_SOUNDCLIP_ADD()
                             new_strip = to_track.strips[-1]
-                            _copy_nla_strip(new_strip, strip)
                         else:
                             self.report(
                                 {_WMReport.WARNING},
                                 f'Unsupported NLA strip "{strip.name}"',
                             )
-                    for transition in transitions:
-                        trans_from = to_track.strips[transition - 1]
-                        trans_to = to_track.strips[transition]
-                        _NLA_SELECT_ALL(action="DESELECT")
-                        trans_from.select = trans_to.select = True
-                        _NLA_TRANSITION_ADD()
-                        trans_from.select = trans_to.select = False
+                            continue
+                        _set_attrs(new_strip, _NLA_STRIP_ATTRS, values)
+                        to_strips.append(new_strip)
+                    _add_nla_transitions(to_strips, transitions)
                 finally:
                     to_track.lock = lock
                     context.scene.frame_current = current_frame
@@ -186,6 +231,31 @@ class RandomizeSelectedNLAStrip(_Op):
         _OpTypeFlag.UNDO,
     }
 
+    distribution_items: _ClassVar = {
+        "UNIFORM": _enum_prop_item(
+            "UNIFORM",
+            "Uniform",
+            "Uniformly between the neighbouring strip(s)",
+            number=0,
+        ),
+        "NORMAL": _enum_prop_item(
+            "NORMAL",
+            "Normal",
+            "Normally around the original time, with the deviation as the standard deviation",
+            number=1,
+        ),
+        "JITTER": _enum_prop_item(
+            "JITTER",
+            "Jitter",
+            "Uniformly within the deviation around the original time",
+            number=2,
+        ),
+    }
+    distribution: _Annotated[str, _EnumProp]
+    deviation: _Annotated[float, _FloatProp]
+    use_seed: _Annotated[bool, _BoolProp]
+    seed: _Annotated[int, _IntProp]
+
     @classmethod
     def poll(  # type: ignore
         cls,
@@ -193,68 +263,142 @@ class RandomizeSelectedNLAStrip(_Op):
     ) -> bool:
         return bool(context.selected_nla_strips)
 
+    def _random_start(
+        self,
+        random: _Random,
+        original: float,
+        start_min: int,
+        start_max: int,
+    ) -> int:
+        if self.distribution == "UNIFORM":
+            return random.randint(start_min, start_max)
+        offset = (
+            random.gauss(0, self.deviation)
+            if self.distribution == "NORMAL"
+            else random.uniform(-self.deviation, self.deviation)
+        )
+        return min(max(round(original + offset), start_min), start_max)
+
     def execute(
         self,
         context: _Ctx,
     ) -> set[str]:
         processed = 0
+        reporter = _Reporter(self, context)
+        random = _Random(self.seed if self.use_seed else None)
+        frame_start, frame_end = context.scene.frame_start, context.scene.frame_end
+
+        selected = dict[_ID, list[_NlaStrip]]()
         for nla_strip in context.selected_nla_strips:
-            nla_tracks = (
-                track
-                for track in _ensure_anim_d(_cast(_ID, nla_strip.id_data)).nla_tracks
-                if nla_strip in track.strips.values()  # type: ignore
-            )
             try:
-                nla_track = next(nla_tracks)
-            except StopIteration:
-                self.report(
-                    {_WMReport.WARNING},
-                    f'Cannot find NLA track for strip "{nla_strip.name}"',
-                )
-                continue
-            finally:
-                del nla_tracks
-            if nla_track.lock:
-                self.report(
-                    {_WMReport.WARNING},
-                    f'NLA track "{nla_track.name}" for strip "{nla_strip.name}" is locked',
-                )
-                continue
-            index = nla_track.strips.find(nla_strip.name)
-            if index == -1:
-                self.report(
-                    {_WMReport.WARNING},
-                    f'Cannot find NLA strip "{nla_strip.name}" in track "{nla_track.name}"',
-                )
-                continue
-
-            length = nla_strip.frame_end - nla_strip.frame_start
-            start_min = (
-                int(nla_track.strips[index - 1].frame_end)
-                if index >= 1
-                else context.scene.frame_start
-            )
-            start_max = int(
-                (
-                    nla_track.strips[index + 1].frame_start
-                    if (index + 1) < len(nla_track.strips)
-                    else context.scene.frame_end
-                )
-                - length
-            )
-            if start_min > start_max:
-                self.report(
-                    {_WMReport.WARNING},
-                    f'Cannot randomize NLA strip "{nla_track.name}" [{start_min}, {start_max}]',
-                )
-                continue
-            nla_strip.frame_start_ui = _randint(start_min, start_max)
-            self.report({_WMReport.INFO}, f'Randomized NLA strip "{nla_strip.name}"')
-            processed += 1
-        self.report({_WMReport.INFO}, f"Randomized {processed} NLA strip(s)")
+                selected[nla_strip.id_data].append(nla_strip)
+            except KeyError:
+                selected[nla_strip.id_data] = [nla_strip]
+        for id, nla_strips in selected.items():
+            # index every strip of the ID once, instead of searching per strip
+            nla_tracks = _ensure_anim_d(id).nla_tracks
+            locations = {
+                strip: (track_index, index)
+                for track_index, track in enumerate(nla_tracks)
+                for index, strip in enumerate(track.strips)
+            }
+            tracks = dict[int, list[int]]()
+            for nla_strip in nla_strips:
+                try:
+                    track_index, index = locations[nla_strip]
+                except KeyError:
+                    reporter.detail(
+                        _WMReport.WARNING,
+                        'Cannot find NLA track for strip "{}"',
+                        nla_strip.name,
+                    )
+                    continue
+                try:
+                    tracks[track_index].append(index)
+                except KeyError:
+                    tracks[track_index] = [index]
+
+            for track_index, indices in tracks.items():
+                nla_track = nla_tracks[track_index]
+                if nla_track.lock:
+                    reporter.detail(
+                        _WMReport.WARNING,
+                        'NLA track "{}" is locked, skipping {} strip(s)',
+                        nla_track.name,
+                        len(indices),
+                    )
+                    continue
+                track_strips = nla_track.strips
+                starts = [strip.frame_start for strip in track_strips]
+                ends = [strip.frame_end for strip in track_strips]
+                # left to right, so each strip sees the new end of the previous one
+                for index in sorted(indices):
+                    nla_strip = track_strips[index]
+                    length = ends[index] - starts[index]
+                    start_min = int(ends[index - 1]) if index >= 1 else frame_start
+                    start_max = int(
+                        (starts[index + 1] if index + 1 < len(starts) else frame_end)
+                        - length
+                    )
+                    if start_min > start_max:
+                        reporter.detail(
+                            _WMReport.WARNING,
+                            'Cannot randomize NLA strip "{}" [{}, {}]',
+                            nla_strip.name,
+                            start_min,
+                            start_max,
+                        )
+                        continue
+                    start = self._random_start(
+                        random,
+                        starts[index],
+                        start_min,
+                        start_max,
+                    )
+                    nla_strip.frame_start_ui = start
+                    starts[index], ends[index] = start, start + length
+                    reporter.detail(
+                        _WMReport.INFO, 'Randomized NLA strip "{}"', nla_strip.name
+                    )
+                    processed += 1
+        reporter.summary(_WMReport.INFO, f"Randomized {processed} NLA strip(s)")
         return {_OpReturn.FINISHED} if processed > 0 else {_OpReturn.CANCELLED}
 
 
+RandomizeSelectedNLAStrip.__annotations__.update(
+    {
+        "distribution": _EnumProp(
+            name="Distribution",
+            items=RandomizeSelectedNLAStrip.distribution_items.values(),  # type: ignore
+            description="Distribution of the new time of strip(s)",
+            default="UNIFORM",
+            options={_PropFlag.SKIP_SAVE},
+        ),
+        "deviation": _FloatProp(
+            name="Deviation",
+            description="Number of frames the time of strip(s) deviates by, "
+            "for the normal and jitter distributions",
+            default=5,
+            min=0,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+        "use_seed": _BoolProp(
+            name="Use Seed",
+            description="Use the seed, so that the result is reproducible",
+            default=False,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+        "seed": _IntProp(
+            name="Seed",
+            description="Seed of the random number generator",
+            default=0,
+            min=0,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+    }
+)
+
+
 class SynchronizeSteppedInterpolationFModifier(_Op):
     """Synchronize stepped interpolation F-modifier(s) for selected NLA strip(s)"""
 
@@ -297,34 +441,35 @@ class SynchronizeSteppedInterpolationFModifier(_Op):
         self,
         context: _Ctx,
     ) -> set[str]:
-        processed = 0
         strips = tuple(context.selected_nla_strips)
-        _NLA_SELECT_ALL(action="DESELECT")
+        mods = list[tuple[_NlaStrip, _FModStepped]]()
+        adds = list[_NlaStrip]()
         for strip in strips:
-            try:
-                if self.select == "ALWAYS_ADD":
-                    raise IndexError()
-                mod = tuple(
-                    mod for mod in strip.modifiers if mod.type == _FModType.STEPPED
-                )[self.existing_index]
-            except IndexError:
-                if self.select == "USE_EXISTING":
-                    continue
+            mod = (
+                None
+                if self.select == "ALWAYS_ADD"
+                else _stepped_fmodifier(strip.modifiers, self.existing_index)
+            )
+            if mod is not None:
+                mods.append((strip, mod))
+            elif self.select != "USE_EXISTING":
+                adds.append(strip)
+        if adds:
+            # strips have no data API for F-modifiers, so add them in 1 call
+            _NLA_SELECT_ALL(action="DESELECT")
+            for strip in adds:
                 strip.select = True
-                _NLA_FMODIFIER_ADD(type=_FModType.STEPPED, only_active=False)
-                strip.select = False
-                mod = next(
-                    mod
-                    for mod in reversed(strip.modifiers)
-                    if mod.type == _FModType.STEPPED
-                )
-            mod = _cast(_FModStepped, mod)
+            _NLA_FMODIFIER_ADD(type=_FModType.STEPPED, only_active=False)
+            for strip in strips:
+                strip.select = True
+            # F-modifiers are appended
+            mods.extend(
+                (strip, _cast(_FModStepped, strip.modifiers[-1])) for strip in adds
+            )
+        for strip, mod in mods:
             mod.frame_step = self.step_size
             mod.frame_offset = -strip.frame_start + self.offset
-            processed += 1
-        for strip in strips:
-            strip.select = True
-        return {_OpReturn.FINISHED} if processed > 0 else {_OpReturn.CANCELLED}
+        return {_OpReturn.FINISHED} if mods else {_OpReturn.CANCELLED}
 
     def invoke(
         self,
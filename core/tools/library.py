@@ -1,4 +1,8 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
+from bpy.app import handlers as _app_handlers
+from bpy.props import (
+    EnumProperty as _EnumProp,  # type: ignore
+)
 from bpy.types import (
     Context as _Ctx,
     ID as _ID,
@@ -6,22 +10,32 @@ from bpy.types import (
     Operator as _Op,
 )
 from typing import (
+    Annotated as _Annotated,
     Any as _Any,
     Callable as _Callable,
-    Collection as _Collect,
     ClassVar as _ClassVar,
+    Collection as _Collect,
+    Sequence as _Seq,
     cast as _cast,
 )
 
 from ..patches import contains as _contains, getitem as _getitem
 from ..utils import copy_attrs as _copy_attrs
-from ..utils.data import all as _all
+from ..utils.data import (
+    all as _all,
+    invalidate_library_ids as _inval_lib_ids,
+    library_ids as _lib_ids,
+    update_library_ids as _upd_lib_ids,
+)
 from ..utils.enums import (
     OperatorReturn as _OpReturn,
     OperatorTypeFlag as _OpTypeFlag,
+    PropertyFlagEnum as _PropFlag,
     SpaceType as _SpaceType,
     WMReport as _WMReport,
 )
+from ..utils.props import enum_property_item as _enum_prop_item
+from ..utils.report import Reporter as _Reporter
 from ..utils.types import (
     Drawer as _Drawer,
     draw_func_class as _draw_func_class,
@@ -32,6 +46,43 @@ from ..utils.utils import (
 )
 
 
+def _users_first(context: _Ctx, ids: _Seq[_ID]) -> tuple[list[_ID], int]:
+    # a data-block used only by library data-block(s) cannot be made local before them,
+    # also returns the passes needed to make the acyclic ones local in listed order
+    members = set(ids)
+    user_map = context.blend_data.user_map(subset=ids)
+    users_of = dict[_ID, set[_ID]]()
+    uses = {id: list[_ID]() for id in ids}
+    pending = dict[_ID, int]()
+    for id in ids:
+        users = users_of[id] = user_map.get(id, set()) & members
+        users.discard(id)
+        pending[id] = len(users)
+        for user in users:
+            uses[user].append(id)
+    order = [id for id in ids if not pending[id]]
+    for user in order:
+        for id in uses[user]:
+            pending[id] -= 1
+            if not pending[id]:
+                order.append(id)
+    # in listed order, a data-block listed before one of its users waits a pass more
+    positions = {id: index for index, id in enumerate(ids)}
+    listed_passes = dict[_ID, int]()
+    for id in order:
+        listed_passes[id] = max(
+            (
+                listed_passes[user] + (positions[user] > positions[id])
+                for user in users_of[id]
+            ),
+            default=1,
+        )
+    # cycles are left in their original order for the retry passes
+    ordered = set(order)
+    order.extend(id for id in ids if id not in ordered)
+    return order, max(listed_passes.values(), default=0)
+
+
 class RemapUserToLibraryByName(_Op):
     """Remap selected local data-block(s) to library data-block(s) by name"""
 
@@ -43,6 +94,22 @@ class RemapUserToLibraryByName(_Op):
         _OpTypeFlag.UNDO,
     }
 
+    priority_items: _ClassVar = {
+        "FIRST": _enum_prop_item(
+            "FIRST",
+            "First",
+            "Prefer the library listed first if multiple libraries have the name",
+            number=0,
+        ),
+        "LAST": _enum_prop_item(
+            "LAST",
+            "Last",
+            "Prefer the library listed last if multiple libraries have the name",
+            number=1,
+        ),
+    }
+    priority: _Annotated[str, _EnumProp]
+
     @classmethod
     def poll(  # type: ignore
         cls,
@@ -59,25 +126,45 @@ class RemapUserToLibraryByName(_Op):
         context: _Ctx,
     ) -> set[str]:
         processed = 0
-        local_users = {
-            (type(id), id.name): id for id in context.selected_ids if not id.library
-        }
+        reporter = _Reporter(self, context)
+        lib_ids = _lib_ids(context)
+        all_data = _all(context)
+        pick = 0 if self.priority == "FIRST" else -1
         for lib_user, local_user in (
-            (user, local_users[type(user), user.name])
-            for lib in context.blend_data.libraries
-            for user in _cast(_Collect[_ID], lib.users_id)
-            if (type(user), user.name) in local_users
+            (all_data[type(id)].get((id.name, lib_ids[type(id), id.name][pick])), id)
+            for id in context.selected_ids
+            if not id.library and (type(id), id.name) in lib_ids
         ):
+            if lib_user is None:
+                # renamed or removed since the index was built
+                continue
             local_user.user_remap(lib_user)
             processed += 1
-            self.report(
-                {_WMReport.INFO},
-                f'Remapped "{local_user.name_full}" to "{lib_user.name_full}"',
+            reporter.detail(
+                _WMReport.INFO,
+                'Remapped "{}" to "{}"',
+                local_user.name_full,
+                lib_user.name_full,
             )
-        self.report({_WMReport.INFO}, f"Remapped {processed} data-block(s)")
+        reporter.summary(_WMReport.INFO, f"Remapped {processed} data-block(s)")
         return {_OpReturn.FINISHED} if processed > 0 else {_OpReturn.CANCELLED}
 
 
+RemapUserToLibraryByName.__annotations__.update(
+    {
+        "priority": _EnumProp(
+            name="Priority",
+            items=RemapUserToLibraryByName.priority_items.values(),  # type: ignore
+            description="Library data-block to remap to if multiple libraries have the name",
+            default="FIRST",
+            options={
+                _PropFlag.SKIP_SAVE,
+            },
+        )
+    }
+)
+
+
 class RemapUserToLocalByName(_Op):
     """Remap selected library data-block(s) to local data-block(s) by name"""
 
@@ -147,34 +234,56 @@ class LocalizeLibrary(_Op):
         self,
         context: _Ctx,
     ) -> set[str]:
-        users = tuple(
-            user
-            for lib in context.selected_ids
-            if isinstance(lib, _Lib)
-            for user in _cast(_Collect[_ID], lib.users_id)
+        # listed in the order that the previous implementation made them local
+        users, listed_passes = _users_first(
+            context,
+            tuple(
+                user
+                for lib in context.selected_ids
+                if isinstance(lib, _Lib)
+                for user in _cast(_Collect[_ID], lib.users_id)
+            ),
         )
         to_be_processed = len(users)
-        while users:
-            retry_users = list[_ID]()
-            for user in (user.make_local() for user in users):
-                if not user.library:
-                    self.report({_WMReport.INFO}, f'Made "{user.name_full}" local')
-                else:
-                    retry_users.append(user)
-            if len(retry_users) == len(users):
-                for user in users:
+        processed = 0
+        passes = 0
+        reporter = _Reporter(self, context)
+        wm = context.window_manager
+        wm.progress_begin(0, to_be_processed)
+        try:
+            while users:
+                passes += 1
+                retry_users = list[_ID]()
+                for user in (user.make_local() for user in users):
+                    if not user.library:
+                        processed += 1
+                        wm.progress_update(processed)
+                        reporter.detail(
+                            _WMReport.INFO, 'Made "{}" local', user.name_full
+                        )
+                    else:
+                        retry_users.append(user)
+                if len(retry_users) == len(users):
+                    for user in users:
+                        reporter.detail(
+                            _WMReport.WARNING,
+                            'Cannot make "{}" local',
+                            user.name_full,
+                        )
                     self.report(
                         {_WMReport.WARNING},
-                        f'Cannot make "{user.name_full}" local',
+                        f'Cannot make "{len(users)}" data-block(s) local',
                     )
-                self.report(
-                    {_WMReport.WARNING},
-                    f'Cannot make "{len(users)}" data-block(s) local',
-                )
-                break
-            users = retry_users
-        processed = to_be_processed - len(users)
-        self.report({_WMReport.INFO}, f"Made {processed} data-block(s) local")
+                    break
+                users = retry_users
+        finally:
+            wm.progress_end()
+            _inval_lib_ids()
+        reporter.summary(
+            _WMReport.INFO,
+            f"Made {processed} data-block(s) local in {passes} pass(es), "
+            f"saving {max(listed_passes - passes, 0)} pass(es) over listed order",
+        )
         return {_OpReturn.FINISHED} if processed > 0 else {_OpReturn.CANCELLED}
 
 
@@ -288,7 +397,7 @@ class DrawFunc(_Op):
         cls.OUTLINER_MT_context_menu_draw_func(self, context)
 
 
-register, unregister = _reg_cls_fac(
+_register, _unregister = _reg_cls_fac(
     (
         RemapUserToLibraryByName,
         RemapUserToLocalByName,
@@ -297,3 +406,20 @@ register, unregister = _reg_cls_fac(
         DrawFunc,
     )
 )
+
+
+def register():
+    _register()
+    _app_handlers.depsgraph_update_post.append(_upd_lib_ids)
+    _app_handlers.load_post.append(_inval_lib_ids)
+    _app_handlers.undo_post.append(_inval_lib_ids)
+    _app_handlers.redo_post.append(_inval_lib_ids)
+
+
+def unregister():
+    _app_handlers.redo_post.remove(_inval_lib_ids)
+    _app_handlers.undo_post.remove(_inval_lib_ids)
+    _app_handlers.load_post.remove(_inval_lib_ids)
+    _app_handlers.depsgraph_update_post.remove(_upd_lib_ids)
+    _inval_lib_ids()
+    _unregister()
@@ -1,4 +1,5 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
+from bpy import app as _app
 from bpy.props import (
     BoolProperty as _BoolProp,  # type: ignore
     EnumProperty as _EnumProp,  # type: ignore
@@ -8,13 +9,14 @@ from bpy.types import (
     Context as _Ctx,
     ID as _ID,
     Menu as _Menu,
+    Modifier as _Modifier,
+    NodeTree as _NodeTree,
     Operator as _Op,
 )
 from itertools import chain as _chain
 from typing import (
     Annotated as _Annotated,
     Any as _Any,
-    Collection as _Collect,
     ClassVar as _ClassVar,
     Iterable as _Iter,
 )
@@ -30,17 +32,78 @@ from ..utils.enums import (
     WMReport as _WMReport,
 )
 from ..utils.props import enum_property_item as _enum_prop_item
+from ..utils.report import Reporter as _Reporter
 from ..utils.types import (
     Drawer as _Drawer,
     draw_func_class as _draw_func_class,
     internal_operator as _int_op,
 )
 from ..utils.utils import (
-    configure_driver as _cfg_drv,
-    has_driver as _has_drv,
+    DriverIndex as _DriverIndex,
+    configure_drivers_bulk as _cfg_drvs,
+    drivable_properties as _drivable_props,
     register_classes_factory as _reg_cls_fac,
 )
 
+# drivable properties of modifiers, by Blender version and modifier type
+_modifier_props_cache = dict[tuple[_Any, ...], tuple[str, ...]]()
+# drivable geometry nodes inputs, by Blender version and node group interface
+_node_group_inputs_cache = dict[tuple[_Any, ...], tuple[str, ...]]()
+# socket types whose modifier inputs are numbers or arrays of them, which are
+# drivable unlike data-blocks or strings, including subtypes before Blender 4.0
+_DRIVABLE_SOCKET_TYPES = (
+    "NodeSocketBool",
+    "NodeSocketColor",
+    "NodeSocketFloat",
+    "NodeSocketInt",
+    "NodeSocketMenu",
+    "NodeSocketRotation",
+    "NodeSocketVector",
+)
+
+
+def _node_group_interface(node_group: _NodeTree) -> tuple[tuple[str, str], ...]:
+    interface = getattr(node_group, "interface", None)
+    if interface is None:
+        # before Blender 4.0
+        return tuple(
+            (socket.identifier, socket.bl_socket_idname) for socket in node_group.inputs
+        )
+    return tuple(
+        (item.identifier, item.socket_type)
+        for item in interface.items_tree
+        if item.item_type == "SOCKET" and item.in_out == "INPUT"
+    )
+
+
+def _modifier_props(modifier: _Modifier):
+    key = (_app.version, _ObjModifierType(modifier.type))
+    try:
+        return _modifier_props_cache[key]
+    except KeyError:
+        pass
+    props = _modifier_props_cache[key] = tuple(
+        prop
+        for prop in _drivable_props(modifier)
+        if prop not in LinkModifierByName.exclude_attrs
+    )
+    return props
+
+
+def _node_group_inputs(interface: tuple[tuple[str, str], ...]):
+    # inputs are ID properties of the modifier named by socket identifiers
+    key = (_app.version, interface)
+    try:
+        return _node_group_inputs_cache[key]
+    except KeyError:
+        pass
+    ret = _node_group_inputs_cache[key] = tuple(
+        identifier
+        for identifier, socket_type in interface
+        if socket_type.startswith(_DRIVABLE_SOCKET_TYPES)
+    )
+    return ret
+
 
 class LinkModifierByName(_Op):
     """Link modifiers from active modifier to modifiers of selected object(s) by name"""
@@ -85,53 +148,74 @@ class LinkModifierByName(_Op):
     ) -> set[str]:
         modifiers = 0
         drivers = 0
+        driver_index = _DriverIndex()
+        reporter = _Reporter(self, context)
 
         from_object = context.active_object
         from_modifier = from_object.modifiers.active
         modifier_name: _Any = from_modifier.name
         modifier_type = _ObjModifierType(from_modifier.type)
-        modifier_attrs = tuple(
-            filter(lambda attr: attr not in self.exclude_attrs, dir(from_modifier))
+        data_paths = tuple(
+            f'modifiers["{modifier_name}"].{attr}'
+            for attr in _modifier_props(from_modifier)
         )
+        # geometry nodes inputs, linked only to modifiers with the same interface
+        interfaces = dict[_NodeTree, tuple[tuple[str, str], ...]]()
+        interface = None
+        input_paths = ()
+        if modifier_type == _ObjModifierType.NODES and from_modifier.node_group:
+            interface = interfaces[from_modifier.node_group] = _node_group_interface(
+                from_modifier.node_group
+            )
+            input_paths = tuple(
+                f'modifiers["{modifier_name}"]["{identifier}"]'
+                for identifier in _node_group_inputs(interface)
+            )
         for to_object in filter(
             lambda obj: obj != from_object and modifier_name in obj.modifiers,
             context.selected_objects,
         ):
             to_modifier = to_object.modifiers[modifier_name]
             if to_modifier.type == modifier_type:
-                to_drivers = 0
-                for modifier_attr in modifier_attrs:
-                    data_path = f'modifiers["{modifier_name}"].{modifier_attr}'
-                    if _has_drv(to_object, data_path):
-                        continue
-                    try:
-                        curves = to_object.driver_add(data_path)
-                    except TypeError:
-                        continue
-                    if isinstance(curves, _Collect):
-                        multiple = True
-                    else:
-                        multiple = False
-                        curves = (curves,)
-                    for index, curve in enumerate(curves):
-                        _cfg_drv(
-                            curve.driver,
-                            id_type=_IDType.OBJECT,
-                            id=from_object,
-                            data_path=f"{data_path}[{index}]"
-                            if multiple
-                            else data_path,
-                        )
-                        curve.lock = True
-                    to_drivers += len(curves)
+                to_paths = data_paths
+                if input_paths:
+                    node_group = to_modifier.node_group
+                    if node_group:
+                        try:
+                            to_interface = interfaces[node_group]
+                        except KeyError:
+                            to_interface = interfaces[node_group] = (
+                                _node_group_interface(node_group)
+                            )
+                        if to_interface == interface:
+                            to_paths = data_paths + input_paths
+                curves, skipped = _cfg_drvs(
+                    to_object,
+                    to_paths,
+                    id_type=_IDType.OBJECT,
+                    id=from_object,
+                    drivers=driver_index,
+                )
+                for curve in curves:
+                    curve.lock = True
+                for data_path in skipped:
+                    reporter.detail(
+                        _WMReport.WARNING,
+                        'Skipped hand-written driver of "{}" at "{}"',
+                        to_object.name_full,
+                        data_path,
+                    )
+                to_drivers = len(curves)
                 modifiers += 1
                 drivers += to_drivers
-                self.report(
-                    {_WMReport.INFO},
-                    f'Linked modifier of "{to_object.name_full}" using {to_drivers} driver(s)',
+                reporter.detail(
+                    _WMReport.INFO,
+                    'Linked modifier of "{}" using {} driver(s)',
+                    to_object.name_full,
+                    to_drivers,
                 )
-        self.report(
-            {_WMReport.INFO},
+        reporter.summary(
+            _WMReport.INFO,
             f"Linked {modifiers} modifier(s) using {drivers} driver(s)",
         )
         return {_OpReturn.FINISHED} if drivers > 0 else {_OpReturn.CANCELLED}
@@ -27,8 +27,9 @@ from ..utils.types import (
     internal_operator as _int_op,
 )
 from ..utils.utils import (
+    DriverIndex as _DriverIndex,
     configure_driver as _cfg_drv,
-    has_driver as _has_drv,
+    configure_drivers as _cfg_drvs,
     register_classes_factory as _reg_cls_fac,
 )
 
@@ -105,83 +106,114 @@ class ConfigurePrincipledMaterialDriver(_Op):
         context: _Ctx,
     ) -> set[str]:
         processed = 0
+        skipped = 0
+        drivers = _DriverIndex()
         material = context.material
         node = context.active_node
         node_tree = _cast(_NodeTree, node.id_data)
         inputs = node.inputs
-        if _contains(inputs, "Base Color") and not _has_drv(material, "diffuse_color"):
+        # existing link drivers are reconfigured, and count only if changed,
+        # other drivers are left alone
+        if _contains(inputs, "Base Color"):
             curves = _cast(
-                _Collect[_FCurve],
-                material.driver_add("diffuse_color"),
+                _Collect[_FCurve] | None,
+                drivers.driver_ensure(
+                    material, "diffuse_color", id_type=_IDType.NODETREE
+                ),
             )
-            for index, curve in enumerate(curves):
-                _cfg_drv(
-                    curve.driver,
-                    id_type=_IDType.NODETREE,
-                    id=node_tree,
-                    data_path=f'nodes["{node.name}"].inputs["Base Color"].default_value[{index}]',
+            if curves is None:
+                skipped += 1
+            elif _cfg_drvs(
+                curves,
+                id_type=_IDType.NODETREE,
+                id=node_tree,
+                data_path=f'nodes["{node.name}"].inputs["Base Color"].default_value',
+            ):
+                for curve in curves:
+                    curve.lock = True
+                curves_len = len(curves)
+                processed += curves_len
+                self.report(
+                    {_WMReport.INFO},
+                    f"Configured {curves_len} material color driver(s)",
                 )
-                curve.lock = True
-            curves_len = len(curves)
-            processed += curves_len
-            self.report(
-                {_WMReport.INFO},
-                f"Configured {curves_len} material color driver(s)",
+        if _contains(inputs, "Metallic"):
+            curve = drivers.driver_ensure(
+                material, "metallic", id_type=_IDType.NODETREE
             )
-        if _contains(inputs, "Metallic") and not _has_drv(material, "metallic"):
-            curve = material.driver_add("metallic")
-            _cfg_drv(
+            if curve is None:
+                skipped += 1
+            elif _cfg_drv(
                 curve.driver,
                 id_type=_IDType.NODETREE,
                 id=node_tree,
                 data_path=f'nodes["{node.name}"].inputs["Metallic"].default_value',
+            ):
+                curve.lock = True
+                processed += 1
+                self.report({_WMReport.INFO}, "Configured material metallic driver")
+        if _contains(inputs, "Roughness"):
+            curve = drivers.driver_ensure(
+                material, "roughness", id_type=_IDType.NODETREE
             )
-            curve.lock = True
-            processed += 1
-            self.report({_WMReport.INFO}, "Configured material metallic driver")
-        if _contains(inputs, "Roughness") and not _has_drv(material, "roughness"):
-            curve = material.driver_add("roughness")
-            _cfg_drv(
+            if curve is None:
+                skipped += 1
+            elif _cfg_drv(
                 curve.driver,
                 id_type=_IDType.NODETREE,
                 id=node_tree,
                 data_path=f'nodes["{node.name}"].inputs["Roughness"].default_value',
-            )
-            curve.lock = True
-            processed += 1
-            self.report({_WMReport.INFO}, "Configured material roughness driver")
+            ):
+                curve.lock = True
+                processed += 1
+                self.report({_WMReport.INFO}, "Configured material roughness driver")
         if _contains(inputs, "Alpha"):
-            if material.blend_method == _Mat.BlendMethod.OPAQUE and not _has_drv(
+            if material.blend_method == _Mat.BlendMethod.OPAQUE or drivers.has(
                 material, "blend_method"
             ):
-                curve = material.driver_add("blend_method")
-                _cfg_drv(
+                curve = drivers.driver_ensure(
+                    material, "blend_method", id_type=_IDType.NODETREE
+                )
+                if curve is None:
+                    skipped += 1
+                elif _cfg_drv(
                     curve.driver,
                     id_type=_IDType.NODETREE,
                     id=node_tree,
                     data_path=f'nodes["{node.name}"].inputs["Alpha"].default_value',
                     expr="0 if var == 1 else 5",
-                )
-                curve.lock = True
-                processed += 1
-                self.report({_WMReport.INFO}, "Configured material blend mode driver")
-            if material.shadow_method == _Mat.ShadowMethod.OPAQUE and not _has_drv(
+                ):
+                    curve.lock = True
+                    processed += 1
+                    self.report(
+                        {_WMReport.INFO}, "Configured material blend mode driver"
+                    )
+            if material.shadow_method == _Mat.ShadowMethod.OPAQUE or drivers.has(
                 material, "shadow_method"
             ):
-                curve = material.driver_add("shadow_method")
-                _cfg_drv(
+                curve = drivers.driver_ensure(
+                    material, "shadow_method", id_type=_IDType.NODETREE
+                )
+                if curve is None:
+                    skipped += 1
+                elif _cfg_drv(
                     curve.driver,
                     id_type=_IDType.NODETREE,
                     id=node_tree,
                     data_path=f'nodes["{node.name}"].inputs["Alpha"].default_value',
                     expr="1 if var == 1 else 3",
-                )
-                curve.lock = True
-                processed += 1
-                self.report(
-                    {_WMReport.INFO},
-                    "Configured material shadow mode driver",
-                )
+                ):
+                    curve.lock = True
+                    processed += 1
+                    self.report(
+                        {_WMReport.INFO},
+                        "Configured material shadow mode driver",
+                    )
+        if skipped:
+            self.report(
+                {_WMReport.WARNING},
+                f"Skipped {skipped} hand-written material driver(s)",
+            )
         self.report({_WMReport.INFO}, f"Configured {processed} material driver(s)")
         return {_OpReturn.FINISHED} if processed > 0 else {_OpReturn.CANCELLED}
 
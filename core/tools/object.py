@@ -1,34 +1,42 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
-from bmesh import (
-    from_edit_mesh as _from_e_mesh,
-    update_edit_mesh as _upd_e_mesh,
-)
-from bmesh.types import BMFace as _BMFace
-from bpy.ops import mesh as _mesh, object as _object
+from bpy.app import handlers as _app_handlers
+from bpy.app.handlers import persistent as _persistent
 from bpy.props import (
     EnumProperty as _EnumProp,  # type: ignore
+    FloatProperty as _FloatProp,  # type: ignore
+    IntProperty as _IntProp,  # type: ignore
+    StringProperty as _StringProp,  # type: ignore
 )
 from bpy.types import (
+    Collection as _BCollect,
     Context as _Ctx,
+    Depsgraph as _Depsgraph,
     Event as _Evt,
-    Mesh as _Mesh,
+    FCurve as _FCurve,
+    ID as _ID,
+    Material as _Material,
+    Object as _Obj,
     Operator as _Op,
+    Scene as _Scene,
+)
+from concurrent.futures import (
+    FIRST_COMPLETED as _FIRST_COMPLETED,
+    Future as _Future,
+    ThreadPoolExecutor as _ThreadPoolExec,
+    as_completed as _as_completed,
+    wait as _wait,
 )
-from idprop.types import IDPropertyGroup as _IDPropGrp
-from itertools import islice as _islice
-from math import log10 as _log10
-from mathutils import Vector as _Vec
+from fnmatch import fnmatchcase as _fnmatchcase
+from os import cpu_count as _cpu_count
+from time import perf_counter as _perf_counter
 from typing import (
     Annotated as _Annotated,
-    Callable as _Callable,
-    Collection as _Collect,
+    Any as _Any,
     ClassVar as _ClassVar,
-    NamedTuple as _NamedTuple,
-    cast as _cast,
-    final as _final,
+    Iterable as _Iter,
+    Sequence as _Seq,
 )
 
-from ..patches import contains as _contains
 from ..utils.data import all as _all
 from ..utils.enums import (
     IDType as _IDType,
@@ -40,76 +48,32 @@ from ..utils.enums import (
     PropertySubtype as _PropStype,
     WMReport as _WMReport,
 )
+from ..utils.mesh import (
+    MeshArrays as _MeshArrays,
+    concatenate_meshes as _concat_meshes,
+    face_centers as _face_centers,
+    find_doubles as _find_doubles,
+    merge_vertices as _merge_vertices,
+    read_mesh as _read_mesh,
+    remove_faces as _remove_faces,
+    write_mesh as _write_mesh,
+)
 from ..utils.props import enum_property_item as _enum_prop_item
+from ..utils.report import Reporter as _Reporter
 from ..utils.types import (
     Drawer as _Drawer,
     draw_func_class as _draw_func_class,
     internal_operator as _int_op,
 )
 from ..utils.utils import (
+    DriverIndex as _DriverIndex,
     ensure_animation_data as _ensure_anim_d,
     register_classes_factory as _reg_cls_fac,
 )
 
-_MESH_DELETE = _mesh.delete  # type: ignore
-_MESH_REMOVE_DOUBLES = _mesh.remove_doubles  # type: ignore
-_MESH_SELECT_ALL = _mesh.select_all  # type: ignore
-_OBJECT_CONVERT = _object.convert  # type: ignore
-_OBJECT_DUPLICATES_MAKE_REAL = _object.duplicates_make_real  # type: ignore
-_OBJECT_EDITMODE_TOGGLE = _object.editmode_toggle  # type: ignore
-_OBJECT_JOIN = _object.join  # type: ignore
-_OBJECT_MAKE_LOCAL = _object.make_local  # type: ignore
-_OBJECT_MAKE_SINGLE_USER = _object.make_single_user  # type: ignore
-_OBJECT_SELECT_ALL = _object.select_all  # type: ignore
-_SELECT_FACE_DOUBLES_TOLERANCE = 0.0001
-_SELECT_FACE_DOUBLES_ROUNDING = round(-_log10(_SELECT_FACE_DOUBLES_TOLERANCE) + 1)
-
-
-def _select_face_doubles(mesh: _Mesh):
-    # https://pasteall.org/55201/python
-    bm = _from_e_mesh(mesh)
-    bm_faces = _cast(_Collect[_BMFace], bm.faces)
-
-    @_final
-    class VecFace(_NamedTuple):
-        vec: _Vec
-        face: _BMFace
-
-    faces = [VecFace(vec=face.calc_center_median(), face=face) for face in bm_faces]
-
-    def vec_x(vec: _Vec):
-        return vec.x
-
-    def vec_y(vec: _Vec):
-        return vec.y
-
-    def vec_z(vec: _Vec):
-        return vec.z
-
-    vec_xyz: tuple[
-        _Callable[[_Vec], float],
-        _Callable[[_Vec], float],
-        _Callable[[_Vec], float],
-    ] = (
-        vec_x,
-        vec_y,
-        vec_z,
-    )
-
-    # yay, key instead of cmp...
-    # no tolerance, precision problems -> round
-    for vec_f in vec_xyz:
-        faces.sort(key=lambda vf: round(vec_f(vf.vec), _SELECT_FACE_DOUBLES_ROUNDING))
-
-    # find double faces
-    for index, vf in _islice(enumerate(faces), 1, None):
-        pvf = faces[index - 1]
-        if all(
-            abs(vec_f(pvf.vec) - vec_f(vf.vec)) < _SELECT_FACE_DOUBLES_TOLERANCE
-            for vec_f in vec_xyz
-        ):
-            vf.face.select = pvf.face.select = True
-    _upd_e_mesh(mesh, loop_triangles=False, destructive=False)
+_FACE_DOUBLES_TOLERANCE = 0.0001
+# the default of 'mesh.remove_doubles'
+_MERGE_DISTANCE = 0.0001
 
 
 class ConfigureEEVEEVolumetrics(_Op):
@@ -197,8 +161,107 @@ ConfigureEEVEEVolumetrics.__annotations__.update(
 )
 
 
+def _read_collection(context: _Ctx, collection: _BCollect):
+    # the evaluated meshes of all instances in the collection, in world space
+    data = context.blend_data
+    instance = data.objects.new("", object_data=None)
+    instance.instance_type = _EObj.InstanceType.COLLECTION
+    instance.instance_collection = collection
+    context.scene.collection.objects.link(instance)
+    meshes = list[_MeshArrays]()
+    materials = list[_Material | None]()
+    material_indices = dict[_Material | None, int]()
+    try:
+        depsgraph = context.evaluated_depsgraph_get()
+        depsgraph.update()
+        for object_instance in depsgraph.object_instances:
+            parent = object_instance.parent
+            if (
+                not object_instance.is_instance
+                or parent is None
+                or parent.original != instance
+            ):
+                continue
+            obj = object_instance.object
+            try:
+                # otherwise only the layers needed for display, without all UV maps
+                mesh = obj.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+            except RuntimeError:
+                mesh = None
+            if mesh is None:
+                continue
+            try:
+                material_map = list[int]()
+                for slot in obj.material_slots:
+                    material = slot.material and slot.material.original
+                    try:
+                        index = material_indices[material]
+                    except KeyError:
+                        index = material_indices[material] = len(materials)
+                        materials.append(material)
+                    material_map.append(index)
+                meshes.append(
+                    _read_mesh(
+                        mesh,
+                        object_instance.matrix_world,
+                        material_map=material_map or (0,),
+                    )
+                )
+            finally:
+                obj.to_mesh_clear()
+    finally:
+        data.objects.remove(instance)
+    return _concat_meshes(meshes), materials
+
+
+def _merge_arrays(arrays: _MeshArrays, merge_distance: float, memory_limit: int | None):
+    # only NumPy, so that it runs in parallel on other threads
+    start = _perf_counter()
+    faces = len(arrays.face_sizes)
+    arrays = _remove_faces(
+        arrays,
+        _find_doubles(
+            _face_centers(arrays),
+            _FACE_DOUBLES_TOLERANCE,
+            memory_limit=memory_limit,
+        ),
+    )
+    doubles = faces - len(arrays.face_sizes)
+    arrays = _merge_vertices(arrays, merge_distance)
+    return arrays, doubles, _perf_counter() - start
+
+
+def _memory_limit(mebibytes: int):
+    return mebibytes << 20 if mebibytes else None
+
+
+def _write_collection(
+    context: _Ctx,
+    collection: _BCollect,
+    arrays: _MeshArrays,
+    materials: _Iter[_Material | None],
+):
+    data = context.blend_data
+    mesh = data.meshes.new(collection.name)
+    for material in materials:
+        mesh.materials.append(material)
+    _write_mesh(mesh, arrays)
+    mesh_obj = data.objects.new(collection.name, object_data=mesh)
+    context.scene.collection.objects.link(mesh_obj)
+    return mesh_obj
+
+
+def _select_only(context: _Ctx, objects: _Seq[_Obj]):
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    if objects:
+        context.view_layer.objects.active = objects[-1]
+
+
 class MergeWallCollection(_Op):
-    """Merge a collection of wall(s) into an object"""
+    """Merge a collection of wall(s) into an object, losing seams, sharp edges, creases, custom normals and vertex groups"""
 
     __slots__: _ClassVar = ()
     bl_idname: _ClassVar = "object.merge_wall_collection"
@@ -208,6 +271,9 @@ class MergeWallCollection(_Op):
         _OpTypeFlag.UNDO,
     }
 
+    merge_distance: _Annotated[float, _FloatProp]
+    memory_limit: _Annotated[int, _IntProp]
+
     @classmethod
     def poll(  # type: ignore
         cls,
@@ -223,39 +289,161 @@ class MergeWallCollection(_Op):
         self,
         context: _Ctx,
     ) -> set[str]:
-        data = context.blend_data
-        scene = context.scene
         collection = context.collection
+        arrays, materials = _read_collection(context, collection)
+        arrays, doubles, _ = _merge_arrays(
+            arrays, self.merge_distance, _memory_limit(self.memory_limit)
+        )
+        mesh_obj = _write_collection(context, collection, arrays, materials)
+        _select_only(context, (mesh_obj,))
+        self.report(
+            {_WMReport.INFO},
+            f'Merged "{collection.name}" into {len(arrays.face_sizes)} face(s), '
+            f"removing {doubles} duplicate face(s)",
+        )
+        return {_OpReturn.FINISHED}
 
-        instance = data.objects.new("", object_data=None)
-        instance.instance_type = _EObj.InstanceType.COLLECTION
-        instance.instance_collection = collection
-        scene.collection.objects.link(instance)
-        _OBJECT_SELECT_ALL(action="DESELECT")
-        instance.select_set(True)
-        _OBJECT_DUPLICATES_MAKE_REAL()
-        data.objects.remove(instance)
 
-        _OBJECT_MAKE_LOCAL(type="SELECT_OBDATA")
-        _OBJECT_MAKE_SINGLE_USER(type="SELECTED_OBJECTS", object=True, obdata=True)
-
-        mesh = data.meshes.new(collection.name)
-        mesh_obj = data.objects.new(collection.name, object_data=mesh)
-        scene.collection.objects.link(mesh_obj)
-        mesh_obj.select_set(True)
-        context.view_layer.objects.active = mesh_obj
-        _OBJECT_CONVERT(target="MESH")
-        _OBJECT_JOIN()
-
-        _OBJECT_EDITMODE_TOGGLE()
-        _MESH_SELECT_ALL(action="DESELECT")
-        _select_face_doubles(mesh)
-        _MESH_DELETE(type="FACE")
-        _MESH_SELECT_ALL(action="SELECT")
-        _MESH_REMOVE_DOUBLES()
-        _OBJECT_EDITMODE_TOGGLE()
+MergeWallCollection.__annotations__.update(
+    {
+        "merge_distance": _FloatProp(
+            name="Merge Distance",
+            description="Maximum distance between vertices to merge, or 0 to not merge",
+            default=_MERGE_DISTANCE,
+            min=0,
+            subtype=_PropStype.DISTANCE,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+        "memory_limit": _IntProp(
+            name="Memory Limit",
+            description="Maximum memory in MiB for finding duplicate faces, "
+            "above which they are found in parts spilled to a temporary file, "
+            "or 0 for no limit",
+            default=0,
+            min=0,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+    }
+)
 
-        return {_OpReturn.FINISHED}
+
+class MergeWallCollections(_Op):
+    """Merge each collection of wall(s) matching a pattern into an object, losing seams, sharp edges, creases, custom normals and vertex groups"""
+
+    __slots__: _ClassVar = ()
+    bl_idname: _ClassVar = "object.merge_wall_collections"
+    bl_label: _ClassVar = "Merge Wall Collections"
+    bl_options: _ClassVar = {
+        _OpTypeFlag.REGISTER,
+        _OpTypeFlag.UNDO,
+    }
+
+    pattern: _Annotated[str, _StringProp]
+    merge_distance: _Annotated[float, _FloatProp]
+    memory_limit: _Annotated[int, _IntProp]
+    threads: _Annotated[int, _IntProp]
+
+    @classmethod
+    def poll(  # type: ignore
+        cls,
+        context: _Ctx,
+    ) -> bool:
+        return context.mode == _CtxMode.OBJECT
+
+    def execute(
+        self,
+        context: _Ctx,
+    ) -> set[str]:
+        start = _perf_counter()
+        reporter = _Reporter(self, context)
+        collections = tuple(
+            collection
+            for collection in context.blend_data.collections
+            if _fnmatchcase(collection.name, self.pattern)
+        )
+        workers = self.threads or _cpu_count() or 1
+        mesh_objs = list[_Obj]()
+        # collections being merged, each holding its arrays until written
+        merges = dict[
+            _Future[_Any], tuple[_BCollect, list[_Material | None], int, float]
+        ]()
+
+        def write(future: _Future[_Any]):
+            collection, materials, faces, read_time = merges.pop(future)
+            arrays, doubles, merge_time = future.result()
+            if not len(arrays.face_sizes):
+                reporter.detail(
+                    _WMReport.WARNING,
+                    'Skipped "{}" without faces',
+                    collection.name,
+                )
+                return
+            write_start = _perf_counter()
+            mesh_objs.append(_write_collection(context, collection, arrays, materials))
+            reporter.detail(
+                _WMReport.INFO,
+                'Merged "{}" from {} into {} face(s), removing {} duplicate face(s) '
+                "(read {:.3f} s, merge {:.3f} s, write {:.3f} s)",
+                collection.name,
+                faces,
+                len(arrays.face_sizes),
+                doubles,
+                read_time,
+                merge_time,
+                _perf_counter() - write_start,
+            )
+
+        # reading and writing need Blender, so they are on this thread, but they
+        # overlap merging, with at most 2 collections per thread in memory
+        with _ThreadPoolExec(max_workers=workers) as executor:
+            for collection in collections:
+                if len(merges) >= 2 * workers:
+                    for future in _wait(merges, return_when=_FIRST_COMPLETED).done:
+                        write(future)
+                read_start = _perf_counter()
+                arrays, materials = _read_collection(context, collection)
+                future = executor.submit(
+                    _merge_arrays,
+                    arrays,
+                    self.merge_distance,
+                    _memory_limit(self.memory_limit),
+                )
+                merges[future] = (
+                    collection,
+                    materials,
+                    len(arrays.face_sizes),
+                    _perf_counter() - read_start,
+                )
+                del arrays
+            for future in _as_completed(tuple(merges)):
+                write(future)
+        _select_only(context, mesh_objs)
+        reporter.summary(
+            _WMReport.INFO,
+            f"Merged {len(mesh_objs)} collection(s) in {_perf_counter() - start:.3f} s",
+        )
+        return {_OpReturn.FINISHED} if mesh_objs else {_OpReturn.CANCELLED}
+
+
+MergeWallCollections.__annotations__.update(
+    {
+        "pattern": _StringProp(
+            name="Pattern",
+            description="Shell-style pattern of the names of collection(s) to merge",
+            default="*wall*",
+            options={_PropFlag.SKIP_SAVE},
+        ),
+        "merge_distance": MergeWallCollection.__annotations__["merge_distance"],
+        "memory_limit": MergeWallCollection.__annotations__["memory_limit"],
+        "threads": _IntProp(
+            name="Threads",
+            description="Number of threads to merge with, or 0 for the number of processors",
+            default=0,
+            min=0,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+    }
+)
 
 
 class FixRigifyRigAnimationData(_Op):
@@ -269,6 +457,22 @@ class FixRigifyRigAnimationData(_Op):
         _OpTypeFlag.UNDO,
     }
 
+    mode_items: _ClassVar = {
+        "MISSING": _enum_prop_item(
+            "MISSING",
+            "Missing",
+            "Only copy driver(s) missing from the object, so that fixing again does nothing",
+            number=0,
+        ),
+        "ALL": _enum_prop_item(
+            "ALL",
+            "All",
+            "Copy all driver(s), even if the object already has them",
+            number=1,
+        ),
+    }
+    mode: _Annotated[str, _EnumProp]
+
     @classmethod
     def poll(  # type: ignore
         cls,
@@ -285,29 +489,70 @@ class FixRigifyRigAnimationData(_Op):
         context: _Ctx,
     ) -> set[str]:
         processed = 0
+        added = 0
+        skipped = 0
+        reporter = _Reporter(self, context)
+        # existing drivers of the rigs, and drivers of their data, which may be shared
+        drivers = _DriverIndex()
+        data_drivers = dict[_ID, tuple[_FCurve, ...]]()
         for object in (obj for obj in context.selected_objects if "rig_ui" in obj):
-            animd = _ensure_anim_d(object)
+            try:
+                from_drivers = data_drivers[object.data]
+            except KeyError:
+                animd = getattr(object.data, "animation_data", None)
+                from_drivers = data_drivers[object.data] = (
+                    () if animd is None else tuple(animd.drivers)
+                )
+            if self.mode == "MISSING":
+                to_drivers = tuple(
+                    driver
+                    for driver in from_drivers
+                    if not drivers.has(object, driver.data_path, driver.array_index)
+                )
+            else:
+                to_drivers = from_drivers
+            skipped += len(from_drivers) - len(to_drivers)
             targets = 0
-            for target in (
-                target
-                for driver in _ensure_anim_d(object.data).drivers
-                for variable in animd.drivers.from_existing(
-                    src_driver=driver
-                ).driver.variables
-                for target in variable.targets
-                if target.id_type == _IDType.OBJECT
-            ):
-                target.id = object
-                targets += 1
+            if to_drivers:
+                animd = _ensure_anim_d(object)
+                for driver in to_drivers:
+                    for variable in animd.drivers.from_existing(
+                        src_driver=driver
+                    ).driver.variables:
+                        for target in variable.targets:
+                            if target.id_type == _IDType.OBJECT:
+                                target.id = object
+                                targets += 1
+            added += len(to_drivers)
             processed += 1
-            self.report(
-                {_WMReport.INFO},
-                f'Fixed f{targets} driver target(s) in object "{object.name_full}"',
+            reporter.detail(
+                _WMReport.INFO,
+                'Fixed {} driver target(s) in {} driver(s) of object "{}"',
+                targets,
+                len(to_drivers),
+                object.name_full,
             )
-        self.report({_WMReport.INFO}, f"Fixed {processed} object(s)")
+        reporter.summary(
+            _WMReport.INFO,
+            f"Fixed {processed} object(s), adding {added} driver(s) "
+            f"and skipping {skipped} existing driver(s)",
+        )
         return {_OpReturn.FINISHED} if processed > 0 else {_OpReturn.CANCELLED}
 
 
+FixRigifyRigAnimationData.__annotations__.update(
+    {
+        "mode": _EnumProp(
+            name="Mode",
+            items=FixRigifyRigAnimationData.mode_items.values(),  # type: ignore
+            description="Which driver(s) to copy",
+            default="MISSING",
+            options={_PropFlag.SKIP_SAVE},
+        ),
+    }
+)
+
+
 class CleanUpCustomProperties(_Op):
     """Clean up temporary custom properties created by extensions"""
 
@@ -331,6 +576,24 @@ class CleanUpCustomProperties(_Op):
             "archimesh.hole_enable",
         }
     )
+    # types and names of local data-block(s) that may have gained custom
+    # properties since the last clean up, or None if unknown, such as after
+    # loading a file
+    pending: _ClassVar[set[tuple[type[_ID], str]] | None] = None
+
+    mode_items: _ClassVar = {
+        "FULL": _enum_prop_item("FULL", "Full", "Visit all data-block(s)", number=1),
+        "INCREMENTAL": _enum_prop_item(
+            "INCREMENTAL",
+            "Incremental",
+            "Only visit data-block(s) updated since the last clean up, "
+            "or all data-block(s) if unknown. "
+            "Misses custom properties added without a depsgraph update, "
+            "and data-block(s) renamed after being updated",
+            number=0,
+        ),
+    }
+    mode: _Annotated[str, _EnumProp]
 
     def execute(
         self,
@@ -338,36 +601,84 @@ class CleanUpCustomProperties(_Op):
     ) -> set[str]:
         processed = 0
         p_data = 0
+        reporter = _Reporter(self, context)
+        pending = CleanUpCustomProperties.pending
+        all_data = _all(context)
         for datum in (
-            datum
-            for data in _all(context).values()
-            for datum in data
-            if not datum.library
+            tuple(all_data[type_].get((name, None)) for type_, name in pending)
+            if self.mode == "INCREMENTAL" and pending is not None
+            else (
+                datum
+                for data in all_data.values()
+                for datum in data
+                if not datum.library
+            )
         ):
+            if datum is None:
+                # removed or renamed since it was recorded
+                continue
             p_keys = 0
-            prop = _cast(_IDPropGrp, datum.id_properties_ensure())
             for delete_key in self.delete_keys:
-                if _contains(prop, delete_key):
-                    val = prop.pop(delete_key, None)
+                # does not create the custom properties of the data-block
+                if delete_key in datum:
+                    val = datum.pop(delete_key, None)
                     p_keys += 1
-                    self.report(
-                        {_WMReport.INFO},
-                        f'Removed custom property "{delete_key}" from data-block "{datum.name_full}": {val}',
+                    reporter.detail(
+                        _WMReport.INFO,
+                        'Removed custom property "{}" from data-block "{}": {}',
+                        delete_key,
+                        datum.name_full,
+                        val,
                     )
             if p_keys > 0:
                 processed += p_keys
                 p_data += 1
-                self.report(
-                    {_WMReport.INFO},
-                    f'Removed {p_keys} custom property(s) from data-block "{datum.name_full}"',
+                reporter.detail(
+                    _WMReport.INFO,
+                    'Removed {} custom property(s) from data-block "{}"',
+                    p_keys,
+                    datum.name_full,
                 )
-        self.report(
-            {_WMReport.INFO},
+        CleanUpCustomProperties.pending = set()
+        reporter.summary(
+            _WMReport.INFO,
             f"Removed {processed} custom property(s) from {p_data} data-block(s)",
         )
         return {_OpReturn.FINISHED} if processed > 0 else {_OpReturn.CANCELLED}
 
 
+CleanUpCustomProperties.__annotations__.update(
+    {
+        "mode": _EnumProp(
+            name="Mode",
+            items=CleanUpCustomProperties.mode_items.values(),  # type: ignore
+            description="Data-block(s) to visit",
+            default="FULL",
+            options={
+                _PropFlag.SKIP_SAVE,
+            },
+        )
+    }
+)
+
+
+@_persistent
+def _track_custom_properties(scene: _Scene, depsgraph: _Depsgraph):
+    pending = CleanUpCustomProperties.pending
+    if pending is None:
+        return
+    delete_keys = CleanUpCustomProperties.delete_keys
+    for update in depsgraph.updates:
+        id = update.id.original
+        if not id.library and any(key in id for key in delete_keys):
+            pending.add((type(id), id.name))
+
+
+@_persistent
+def _forget_custom_properties(*_: _Any):
+    CleanUpCustomProperties.pending = None
+
+
 @_draw_func_class
 @_int_op(uuid="9c6c6894-c400-4edc-a21a-2bcb230c8f2a")
 class DrawFunc(_Op):
@@ -391,6 +702,8 @@ class DrawFunc(_Op):
         if MergeWallCollection.poll(context):
             self.layout.separator()
             self.layout.operator(MergeWallCollection.bl_idname)
+        if MergeWallCollections.poll(context):
+            self.layout.operator(MergeWallCollections.bl_idname)
 
     @classmethod
     def VIEW3D_MT_object_animation_draw_func(
@@ -430,12 +743,30 @@ class DrawFunc(_Op):
         cls.OUTLINER_MT_context_menu_draw_func(self, context)
 
 
-register, unregister = _reg_cls_fac(
+_register, _unregister = _reg_cls_fac(
     (
         CleanUpCustomProperties,
         ConfigureEEVEEVolumetrics,
         MergeWallCollection,
+        MergeWallCollections,
         FixRigifyRigAnimationData,
         DrawFunc,
     )
 )
+
+
+def register():
+    _register()
+    _app_handlers.depsgraph_update_post.append(_track_custom_properties)
+    _app_handlers.load_post.append(_forget_custom_properties)
+    _app_handlers.undo_post.append(_forget_custom_properties)
+    _app_handlers.redo_post.append(_forget_custom_properties)
+
+
+def unregister():
+    _app_handlers.redo_post.remove(_forget_custom_properties)
+    _app_handlers.undo_post.remove(_forget_custom_properties)
+    _app_handlers.load_post.remove(_forget_custom_properties)
+    _app_handlers.depsgraph_update_post.remove(_track_custom_properties)
+    _forget_custom_properties()
+    _unregister()
@@ -0,0 +1,213 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+from bpy.props import (
+    BoolProperty as _BoolProp,  # type: ignore
+    EnumProperty as _EnumProp,  # type: ignore
+    StringProperty as _StringProp,  # type: ignore
+)
+from bpy.types import (
+    Context as _Ctx,
+    Event as _Evt,
+    Operator as _Op,
+)
+from csv import writer as _csv_writer
+from dataclasses import asdict as _asdict, fields as _fields
+from json import dump as _dump
+from math import ceil as _ceil
+from typing import Annotated as _Annotated, Any as _Any, ClassVar as _ClassVar
+
+from ..utils.enums import (
+    OperatorReturn as _OpReturn,
+    OperatorTypeFlag as _OpTypeFlag,
+    PropertyFlagEnum as _PropFlag,
+    PropertySubtype as _PropStype,
+    WMReport as _WMReport,
+)
+from ..utils.props import enum_property_item as _enum_prop_item
+from ..utils.types import (
+    Drawer as _Drawer,
+    ProfileSample as _ProfileSample,
+    draw_func_class as _draw_func_class,
+    internal_operator as _int_op,
+    profile_samples as _profile_samples,
+    set_profiling as _set_profiling,
+)
+from ..utils.utils import (
+    register_classes_factory as _reg_cls_fac,
+)
+
+
+def _summarize(samples: tuple[_ProfileSample, ...]):
+    durations = dict[tuple[str, str], list[float]]()
+    reports = dict[tuple[str, str], int]()
+    for sample in samples:
+        key = (sample.operator, sample.method)
+        try:
+            durations[key].append(sample.duration)
+            reports[key] += sample.reports
+        except KeyError:
+            durations[key] = [sample.duration]
+            reports[key] = sample.reports
+    summary = list[dict[str, _Any]]()
+    for (operator, method), times in durations.items():
+        times.sort()
+        summary.append(
+            {
+                "operator": operator,
+                "method": method,
+                "calls": len(times),
+                "total": sum(times),
+                "p95": times[_ceil(len(times) * 0.95) - 1],
+                "reports": reports[operator, method],
+            }
+        )
+    return summary
+
+
+class DumpProfile(_Op):
+    """Write operator profile samples collected in this session to a file"""
+
+    __slots__: _ClassVar = ()
+    bl_idname: _ClassVar = "wm.bccelerator_profile_dump"
+    bl_label: _ClassVar = "Dump bccelerator Profile"
+    bl_options: _ClassVar = {
+        _OpTypeFlag.REGISTER,
+    }
+
+    filepath: _Annotated[str, _StringProp]
+    format_items: _ClassVar = {
+        "JSON": _enum_prop_item(
+            "JSON", "JSON", "Summary per operator and all samples", number=0
+        ),
+        "CSV": _enum_prop_item("CSV", "CSV", "All samples, one per row", number=1),
+    }
+    format: _Annotated[str, _EnumProp]
+    clear: _Annotated[bool, _BoolProp]
+
+    @classmethod
+    def poll(  # type: ignore
+        cls,
+        context: _Ctx,
+    ) -> bool:
+        return _profile_samples() is not None
+
+    def execute(
+        self,
+        context: _Ctx,
+    ) -> set[str]:
+        profile_samples = _profile_samples()
+        if profile_samples is None:
+            return {_OpReturn.CANCELLED}
+        samples = tuple(profile_samples)
+        try:
+            with open(self.filepath, "w", encoding="UTF-8", newline="") as file:
+                if self.format == "CSV":
+                    writer = _csv_writer(file)
+                    writer.writerow(field.name for field in _fields(_ProfileSample))
+                    writer.writerows(_asdict(sample).values() for sample in samples)
+                else:
+                    _dump(
+                        {
+                            "summary": _summarize(samples),
+                            "samples": tuple(map(_asdict, samples)),
+                        },
+                        file,
+                        indent=2,
+                    )
+        except OSError as ex:
+            self.report({_WMReport.ERROR}, f'Cannot write "{self.filepath}": {ex}')
+            return {_OpReturn.CANCELLED}
+        if self.clear:
+            profile_samples.clear()
+        self.report(
+            {_WMReport.INFO}, f'Wrote {len(samples)} sample(s) to "{self.filepath}"'
+        )
+        return {_OpReturn.FINISHED}
+
+    def invoke(  # type: ignore
+        self,
+        context: _Ctx,
+        event: _Evt,
+    ):
+        context.window_manager.fileselect_add(self)
+        return {_OpReturn.RUNNING_MODAL}
+
+
+DumpProfile.__annotations__.update(
+    {
+        "filepath": _StringProp(
+            name="File Path",
+            description="File to write the profile to",
+            subtype=_PropStype.FILE_PATH,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+        "format": _EnumProp(
+            name="Format",
+            items=DumpProfile.format_items.values(),  # type: ignore
+            description="Format of the profile",
+            default="JSON",
+            options={_PropFlag.SKIP_SAVE},
+        ),
+        "clear": _BoolProp(
+            name="Clear",
+            description="Clear the collected samples after writing them",
+            default=False,
+            options={_PropFlag.SKIP_SAVE},
+        ),
+    }
+)
+
+
+class ToggleProfile(_Op):
+    """Start or stop collecting operator profile samples"""
+
+    __slots__: _ClassVar = ()
+    bl_idname: _ClassVar = "wm.bccelerator_profile_toggle"
+    bl_label: _ClassVar = "Toggle bccelerator Profiling"
+    bl_options: _ClassVar = {
+        _OpTypeFlag.REGISTER,
+    }
+
+    def execute(
+        self,
+        context: _Ctx,
+    ) -> set[str]:
+        enabled = _profile_samples() is None
+        _set_profiling(enabled)
+        self.report(
+            {_WMReport.INFO},
+            "Started profiling" if enabled else "Stopped profiling",
+        )
+        return {_OpReturn.FINISHED}
+
+
+@_draw_func_class
+@_int_op(uuid="5b0f4a3e-62d1-4c4f-9d0e-2f8a7c1e9b36")
+class DrawFunc(_Op):
+    __slots__: _ClassVar = ()
+
+    @classmethod
+    def TOPBAR_MT_help_draw_func(
+        cls,
+        self: _Drawer,
+        context: _Ctx,
+    ):
+        self.layout.separator()
+        self.layout.operator(
+            ToggleProfile.bl_idname,
+            text=(
+                "Stop bccelerator Profiling"
+                if _profile_samples() is not None
+                else "Start bccelerator Profiling"
+            ),
+        )
+        if DumpProfile.poll(context):
+            self.layout.operator(DumpProfile.bl_idname)
+
+
+register, unregister = _reg_cls_fac(
+    (
+        DumpProfile,
+        ToggleProfile,
+        DrawFunc,
+    )
+)
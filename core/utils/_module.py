@@ -67,3 +67,12 @@ def copy_attrs(
 ):
     for name in names:
         copy_attr(to_obj, name, from_obj, default)
+
+
+def get_attrs(from_obj: object, names: _Iter[str]) -> tuple[_Any, ...]:
+    return tuple(getattr(from_obj, name) for name in names)
+
+
+def set_attrs(to_obj: object, names: _Iter[str], values: _Iter[_Any]):
+    for name, value in zip(names, values):
+        setattr(to_obj, name, value)
@@ -1,17 +1,31 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
 from bpy import types as _types
+from bpy.app.handlers import persistent as _persistent
 from bpy.types import (
+    BlendData as _BlendData,
     Context as _Ctx,
     Curves as _Curves,
+    Depsgraph as _Depsgraph,
     FreestyleLineStyle as _FreestyleLineStyle,
     ID as _ID,
     Key as _Key,
+    Scene as _Scene,
     VectorFont as _VecFont,
     bpy_prop_collection as _bpy_collect,
 )
 from dataclasses import dataclass as _dataclass
 from re import Pattern as _Pattern, compile as _compile
-from typing import ClassVar as _ClassVar, Mapping as _Map, final as _final
+from typing import (
+    Any as _Any,
+    ClassVar as _ClassVar,
+    Collection as _Collect,
+    Mapping as _Map,
+    Sequence as _Seq,
+    cast as _cast,
+    final as _final,
+)
+
+from .enums import IDType as _IDType
 
 
 @_final
@@ -66,25 +80,84 @@ def _type_from_data_name(key: str) -> type[_ID]:
         raise LookupError(key, tfed_key, names) from ex
 
 
+# filled once per session, as the data collections of a blend file never change
+_data_attrs = dict[type[_ID], str]()
+_data_attrs_cache = dict[type[_ID], str]()
+
+
+def _data_attr(key: type[_ID]) -> str:
+    try:
+        return _data_attrs_cache[key]
+    except KeyError:
+        pass
+    for exist_key, attr in _data_attrs.items():
+        if issubclass(key, exist_key):
+            _data_attrs_cache[key] = attr
+            return attr
+    raise KeyError(key)
+
+
 @_final
-class _BlendDataAll(dict[type[_ID], _bpy_collect[_ID]]):
-    __slots__: _ClassVar = ()
+class _BlendDataAll(_Map[type[_ID], _bpy_collect[_ID]]):
+    __slots__: _ClassVar = ("__data",)
+
+    def __init__(self, data: _BlendData):
+        self.__data = data
+
+    def __getitem__(self, key: type[_ID]) -> _bpy_collect[_ID]:
+        return getattr(self.__data, _data_attr(key))
 
-    def __missing__(self, key: type[_ID]):
-        for exist_key, value in self.items():
-            if issubclass(key, exist_key):
-                self[key] = value
-                return value
-        raise KeyError(key)
+    def __iter__(self):
+        return iter(_data_attrs)
+
+    def __len__(self):
+        return len(_data_attrs)
 
 
 def all(
     context: _Ctx,
 ) -> _Map[type[_ID], _bpy_collect[_ID]]:
-    return _BlendDataAll(
-        {
-            _type_from_data_name(attr): getattr(context.blend_data, attr)
-            for attr in dir(context.blend_data)
-            if isinstance(getattr(context.blend_data, attr), _bpy_collect)
-        }
-    )
+    data = context.blend_data
+    if not _data_attrs:
+        _data_attrs.update(
+            {
+                _type_from_data_name(attr): attr
+                for attr in dir(data)
+                if isinstance(getattr(data, attr), _bpy_collect)
+            }
+        )
+        _data_attrs_cache.update(_data_attrs)
+    return _BlendDataAll(data)
+
+
+# file paths of the libraries of library data-blocks by type and name, in library
+# order, as strings that stay valid across undo, empty when stale
+_library_ids = dict[tuple[type[_ID], str], list[str]]()
+
+
+def library_ids(
+    context: _Ctx,
+) -> _Map[tuple[type[_ID], str], _Seq[str]]:
+    # look data-blocks up by '(name, filepath)' in their blend data collection
+    if not _library_ids:
+        for lib in context.blend_data.libraries:
+            filepath = lib.filepath
+            for id in _cast(_Collect[_ID], lib.users_id):
+                try:
+                    _library_ids[type(id), id.name].append(filepath)
+                except KeyError:
+                    _library_ids[type(id), id.name] = [filepath]
+    return _library_ids
+
+
+@_persistent
+def invalidate_library_ids(*_: _Any):
+    _library_ids.clear()
+
+
+@_persistent
+def update_library_ids(scene: _Scene, depsgraph: _Depsgraph):
+    if depsgraph.id_type_updated(_IDType.LIBRARY) or any(
+        update.id.library for update in depsgraph.updates
+    ):
+        _library_ids.clear()
@@ -0,0 +1,548 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+from bpy.types import Mesh as _Mesh, MeshPolygon as _MeshPolygon
+from dataclasses import dataclass as _dataclass, replace as _replace
+from itertools import product as _product
+import numpy as _np
+from numpy.typing import ArrayLike as _ArrayLike, NDArray as _NDArray
+from tempfile import TemporaryFile as _TempFile
+from typing import (
+    Any as _Any,
+    Iterator as _Iterator,
+    Sequence as _Seq,
+    cast as _cast,
+    final as _final,
+)
+
+# number of points processed at once by the grid hash, bounding temporary memory
+CHUNK_SIZE = 1 << 20
+# memory used per point by the grid hash, and by slabs, in bytes, estimated
+_BYTES_PER_POINT = 96
+_SLAB_BYTES_PER_POINT = 32
+# number of bins that slabs are made of
+_SLAB_BINS = 1 << 16
+# the 13 neighbouring cells "after" a cell, so that each pair of cells is visited once
+_FORWARD_CELLS = _np.array(
+    tuple(offset for offset in _product((-1, 0, 1), repeat=3) if offset > (0, 0, 0)),
+    dtype=_np.int64,
+)
+# 'foreach_get' property, item type and item shape of attribute data types,
+# other data types, such as strings, are not read
+_ATTRIBUTE_TYPES = {
+    "FLOAT": ("value", _np.float32, ()),
+    "INT": ("value", _np.int32, ()),
+    "FLOAT_VECTOR": ("vector", _np.float32, (3,)),
+    "FLOAT_COLOR": ("color", _np.float32, (4,)),
+    "BYTE_COLOR": ("color", _np.float32, (4,)),
+    "BOOLEAN": ("value", _np.bool_, ()),
+    "FLOAT2": ("vector", _np.float32, (2,)),
+    "INT8": ("value", _np.int32, ()),
+    "INT32_2D": ("value", _np.int32, (2,)),
+    "QUATERNION": ("value", _np.float32, (4,)),
+    "FLOAT4X4": ("value", _np.float32, (16,)),
+}
+# attributes read into fields of 'MeshArrays' instead
+_BUILTIN_ATTRIBUTES = frozenset({"position", "material_index", "sharp_face"})
+
+
+@_final
+@_dataclass(
+    init=True,
+    repr=True,
+    eq=False,
+    order=False,
+    unsafe_hash=False,
+    frozen=True,
+    match_args=True,
+    kw_only=True,
+    slots=True,
+)
+class MeshAttribute:
+    # 'domain' is one of 'POINT', 'CORNER' and 'FACE', and 'values' has an item
+    # per element of the domain, of the shape of 'data_type'
+    domain: str
+    data_type: str
+    values: _NDArray[_Any]
+
+
+@_final
+@_dataclass(
+    init=True,
+    repr=True,
+    eq=False,
+    order=False,
+    unsafe_hash=False,
+    frozen=True,
+    match_args=True,
+    kw_only=True,
+    slots=True,
+)
+class MeshArrays:
+    # loops are stored face by face, in the order of faces, and 'uv_maps' names the
+    # attributes written as UV maps
+    positions: _NDArray[_np.float64]
+    loop_vertices: _NDArray[_np.int64]
+    face_sizes: _NDArray[_np.int64]
+    face_materials: _NDArray[_np.int64]
+    face_smooth: _NDArray[_np.bool_]
+    attributes: dict[str, MeshAttribute]
+    uv_maps: tuple[str, ...]
+    active_uv_map: str | None
+
+    @property
+    def face_starts(self) -> _NDArray[_np.int64]:
+        return self.face_sizes.cumsum() - self.face_sizes
+
+    def domain_size(self, domain: str) -> int:
+        if domain == "POINT":
+            return len(self.positions)
+        if domain == "CORNER":
+            return len(self.loop_vertices)
+        return len(self.face_sizes)
+
+
+def _index_attributes(
+    attributes: dict[str, MeshAttribute], **indices: _ArrayLike
+) -> dict[str, MeshAttribute]:
+    # indexes the values of the domains given by keyword, such as 'CORNER=loops'
+    return {
+        name: (
+            _replace(attribute, values=attribute.values[indices[attribute.domain]])
+            if attribute.domain in indices
+            else attribute
+        )
+        for name, attribute in attributes.items()
+    }
+
+
+def _close_pairs(
+    points: _NDArray[_np.float64], tolerance: float, *, chunk_size: int = CHUNK_SIZE
+) -> _Iterator[tuple[_NDArray[_np.int64], _NDArray[_np.int64]]]:
+    # batches of pairs of points closer than tolerance on every axis
+    # points closer than tolerance on every axis are at most 1 cell apart on every axis
+    if not len(points):
+        return
+    cells = _np.floor(points / tolerance).astype(_np.int64)
+    # pack cell coordinates into an int, leaving a margin for the neighbours
+    # overflow wraps consistently, so it only adds candidates that are checked anyway
+    cells -= cells.min(axis=0) - 1
+    radices = cells.max(axis=0) + 2
+    strides = _np.array((radices[1] * radices[2], radices[2], 1), dtype=_np.int64)
+    keys = cells @ strides
+    del cells
+    order = keys.argsort(kind="stable")
+    keys = keys[order]
+
+    # temporaries are per chunk of sorted points, besides the keys and order
+    for chunk in range(0, len(keys), chunk_size):
+        chunk_keys = keys[chunk : chunk + chunk_size]
+        positions = _np.arange(chunk, chunk + len(chunk_keys))
+        for offset in (0, *(_FORWARD_CELLS @ strides)):
+            targets = chunk_keys + offset
+            ends = keys.searchsorted(targets, side="right")
+            # within the same cell, only pair with the points after
+            starts = (
+                positions + 1
+                if offset == 0
+                else keys.searchsorted(targets, side="left")
+            )
+            counts = ends - starts
+            del targets, ends
+            for shift in range(counts.max(initial=0)):
+                lefts = _np.flatnonzero(counts > shift)
+                rights = order[starts[lefts] + shift]
+                lefts = order[lefts + chunk]
+                close = (_np.abs(points[lefts] - points[rights]) < tolerance).all(
+                    axis=1
+                )
+                yield lefts[close], rights[close]
+
+
+def find_doubles(
+    points: _ArrayLike, tolerance: float, *, memory_limit: int | None = None
+) -> _NDArray[_np.bool_]:
+    # 'memory_limit' bounds the memory used in bytes, besides the points and result
+    if memory_limit is not None:
+        # flat coordinates are accepted too, so count the points after reshaping
+        points = _np.asarray(points).reshape(-1, 3)
+        if points.shape[0] * _BYTES_PER_POINT > memory_limit:
+            return _find_doubles_in_slabs(
+                _cast(_NDArray[_np.float64], points), tolerance, memory_limit
+            )
+    points = _np.asarray(points, dtype=_np.float64).reshape(-1, 3)
+    doubles = _np.zeros(len(points), dtype=_np.bool_)
+    for lefts, rights in _close_pairs(points, tolerance):
+        doubles[lefts] = True
+        doubles[rights] = True
+    return doubles
+
+
+def _find_doubles_in_slabs(
+    points: _NDArray[_np.float64], tolerance: float, memory_limit: int
+) -> _NDArray[_np.bool_]:
+    # splits the points into slabs of cells along x that fit in the limit,
+    # each with a copy of the first cells of the next slab, so that pairs
+    # across slabs are found, and spills the slabs to a file if they do not fit
+    points = points.reshape(-1, 3)
+    count = len(points)
+    doubles = _np.zeros(count, dtype=_np.bool_)
+    if not count:
+        return doubles
+    chunk_size = max(memory_limit // _BYTES_PER_POINT, 1)
+    chunks = range(0, count, chunk_size)
+
+    def columns(chunk: int):
+        return _np.floor(
+            _np.asarray(points[chunk : chunk + chunk_size, 0], dtype=_np.float64)
+            / tolerance
+        ).astype(_np.int64)
+
+    column_min, column_max = _np.iinfo(_np.int64).max, _np.iinfo(_np.int64).min
+    for chunk in chunks:
+        chunk_columns = columns(chunk)
+        column_min = min(column_min, int(chunk_columns.min()))
+        column_max = max(column_max, int(chunk_columns.max()))
+    width = -(-(column_max - column_min + 1) // _SLAB_BINS)
+    bin_counts = _np.zeros(_SLAB_BINS, dtype=_np.int64)
+    for chunk in chunks:
+        bin_counts += _np.bincount(
+            (columns(chunk) - column_min) // width, minlength=_SLAB_BINS
+        )
+
+    # greedily group bins into slabs, a bin larger than a slab is its own slab
+    slab_of_bin = _np.empty(_SLAB_BINS, dtype=_np.int64)
+    slab_starts = list[int]()
+    size = chunk_size
+    for bin, bin_count in enumerate(bin_counts.tolist()):
+        if size + bin_count > chunk_size and (size or not slab_starts):
+            slab_starts.append(bin)
+            size = 0
+        size += bin_count
+        slab_of_bin[bin] = len(slab_starts) - 1
+    first_bins = _np.array(slab_starts, dtype=_np.int64)
+    slab_counts = _np.add.reduceat(bin_counts, first_bins)
+    slab_counts[:-1] += bin_counts[first_bins[1:]]
+    slab_offsets = slab_counts.cumsum() - slab_counts
+
+    with _TempFile() as file:
+        total = int(slab_counts.sum())
+        if total * _SLAB_BYTES_PER_POINT > memory_limit:
+            slab_points = _np.memmap(file, dtype=_np.float64, shape=(total, 3))
+            slab_indices = _np.memmap(
+                file,
+                dtype=_np.int64,
+                offset=slab_points.nbytes,
+                shape=(total,),
+            )
+        else:
+            slab_points = _np.empty((total, 3), dtype=_np.float64)
+            slab_indices = _np.empty(total, dtype=_np.int64)
+        cursors = slab_offsets.copy()
+        for chunk in chunks:
+            bins = (columns(chunk) - column_min) // width
+            slabs = slab_of_bin[bins]
+            indices = _np.arange(chunk, chunk + len(bins))
+            # the first bin of a slab is also in the previous slab
+            halos = (bins == first_bins[slabs]) & (slabs > 0)
+            slabs = _np.concatenate((slabs, slabs[halos] - 1))
+            indices = _np.concatenate((indices, indices[halos]))
+            order = slabs.argsort(kind="stable")
+            slabs, indices = slabs[order], indices[order]
+            targets = (
+                cursors[slabs]
+                + _np.arange(len(slabs))
+                - slabs.searchsorted(slabs, side="left")
+            )
+            slab_points[targets] = points[indices]
+            slab_indices[targets] = indices
+            cursors += _np.bincount(slabs, minlength=len(cursors))
+        for offset, slab_count in zip(slab_offsets.tolist(), slab_counts.tolist()):
+            indices = _np.array(slab_indices[offset : offset + slab_count])
+            for lefts, rights in _close_pairs(
+                _np.array(slab_points[offset : offset + slab_count]), tolerance
+            ):
+                doubles[indices[lefts]] = True
+                doubles[indices[rights]] = True
+        del slab_points, slab_indices
+    return doubles
+
+
+def _compress(labels: _NDArray[_np.int64]):
+    # points every label directly to the root of its chain
+    while True:
+        roots = labels[labels]
+        if _np.array_equal(roots, labels):
+            return labels
+        labels = roots
+
+
+def weld_vertices(
+    points: _ArrayLike, distance: float, *, chunk_size: int = CHUNK_SIZE
+) -> _NDArray[_np.int64]:
+    # the lowest index of the group of points connected by distances within
+    # 'distance' for each point, found without collecting all close pairs
+    points = _np.asarray(points, dtype=_np.float64).reshape(-1, 3)
+    labels = _np.arange(len(points))
+    if distance <= 0:
+        return labels
+    for lefts, rights in _close_pairs(points, distance, chunk_size=chunk_size):
+        close = ((points[lefts] - points[rights]) ** 2).sum(axis=1) <= distance**2
+        lefts, rights = lefts[close], rights[close]
+        while len(lefts):
+            # hook the higher root of each pair to the lower one
+            left_roots, right_roots = labels[lefts], labels[rights]
+            differ = left_roots != right_roots
+            lefts, rights = lefts[differ], rights[differ]
+            left_roots, right_roots = left_roots[differ], right_roots[differ]
+            _np.minimum.at(
+                labels,
+                _np.maximum(left_roots, right_roots),
+                _np.minimum(left_roots, right_roots),
+            )
+            labels = _compress(labels)
+    return labels
+
+
+def read_mesh(
+    mesh: _Mesh, matrix: _ArrayLike, *, material_map: _ArrayLike
+) -> MeshArrays:
+    # 'material_map' maps material indices of 'mesh' to those of the result
+    vertices, loops, polygons = mesh.vertices, mesh.loops, mesh.polygons
+    positions = _np.empty(len(vertices) * 3, dtype=_np.float32)
+    vertices.foreach_get("co", positions)
+    matrix = _np.asarray(matrix, dtype=_np.float64)
+    positions = positions.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+    face_starts = _np.empty(len(polygons), dtype=_np.int32)
+    face_sizes = _np.empty(len(polygons), dtype=_np.int32)
+    face_materials = _np.empty(len(polygons), dtype=_np.int32)
+    face_smooth = _np.empty(len(polygons), dtype=_np.bool_)
+    polygons.foreach_get("loop_start", face_starts)
+    polygons.foreach_get("loop_total", face_sizes)
+    polygons.foreach_get("material_index", face_materials)
+    polygons.foreach_get("use_smooth", face_smooth)
+    face_sizes = face_sizes.astype(_np.int64)
+    # loops in the order of faces, reversed for mirroring matrices to keep normals
+    offsets = _np.arange(face_sizes.sum()) - _np.repeat(
+        face_sizes.cumsum() - face_sizes, face_sizes
+    )
+    if _np.linalg.det(matrix[:3, :3]) < 0:
+        offsets = _np.repeat(face_sizes - 1, face_sizes) - offsets
+    face_loops = _np.repeat(face_starts, face_sizes) + offsets
+
+    loop_vertices = _np.empty(len(loops), dtype=_np.int32)
+    loops.foreach_get("vertex_index", loop_vertices)
+
+    # UV maps are not attributes before Blender 3.5, and are read by name either way
+    attributes = dict[str, MeshAttribute]()
+    uv_layers = mesh.uv_layers
+    for uv_layer in uv_layers:
+        uvs = _np.empty(len(loops) * 2, dtype=_np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        attributes[uv_layer.name] = MeshAttribute(
+            domain="CORNER", data_type="FLOAT2", values=uvs.reshape(-1, 2)
+        )
+    uv_maps = tuple(attributes)
+    active_uv_map = uv_layers.active and uv_layers.active.name
+    sizes = {"POINT": len(vertices), "CORNER": len(loops), "FACE": len(polygons)}
+    for attribute in mesh.attributes:
+        name, domain, data_type = attribute.name, attribute.domain, attribute.data_type
+        if (
+            domain not in sizes
+            or data_type not in _ATTRIBUTE_TYPES
+            or name in attributes
+            or name in _BUILTIN_ATTRIBUTES
+            or name.startswith(".")
+        ):
+            continue
+        prop, dtype, shape = _ATTRIBUTE_TYPES[data_type]
+        values = _np.empty(sizes[domain] * _np.prod(shape, dtype=int), dtype=dtype)
+        attribute.data.foreach_get(prop, values)
+        attributes[name] = MeshAttribute(
+            domain=domain, data_type=data_type, values=values.reshape(-1, *shape)
+        )
+    attributes = _index_attributes(attributes, CORNER=face_loops)
+
+    material_map = _np.asarray(material_map, dtype=_np.int64)
+    return MeshArrays(
+        positions=positions,
+        loop_vertices=loop_vertices[face_loops].astype(_np.int64),
+        face_sizes=face_sizes,
+        face_materials=material_map[face_materials.clip(0, len(material_map) - 1)],
+        face_smooth=face_smooth,
+        attributes=attributes,
+        uv_maps=uv_maps,
+        active_uv_map=active_uv_map,
+    )
+
+
+def _concatenate_attributes(meshes: _Seq[MeshArrays]) -> dict[str, MeshAttribute]:
+    # by name, with the domain and data type of its first mesh, zeroed for meshes
+    # without it or with another domain or data type
+    firsts = dict[str, MeshAttribute]()
+    for mesh in meshes:
+        for name, attribute in mesh.attributes.items():
+            firsts.setdefault(name, attribute)
+    ret = dict[str, MeshAttribute]()
+    for name, first in firsts.items():
+        parts = list[_NDArray[_Any]]()
+        for mesh in meshes:
+            attribute = mesh.attributes.get(name)
+            if (
+                attribute is None
+                or attribute.domain != first.domain
+                or attribute.data_type != first.data_type
+            ):
+                parts.append(
+                    _np.zeros(
+                        (mesh.domain_size(first.domain), *first.values.shape[1:]),
+                        dtype=first.values.dtype,
+                    )
+                )
+            else:
+                parts.append(attribute.values)
+        ret[name] = _replace(first, values=_np.concatenate(parts))
+    return ret
+
+
+def concatenate_meshes(meshes: _Seq[MeshArrays]) -> MeshArrays:
+    vertex_offsets = _np.cumsum([0, *(len(mesh.positions) for mesh in meshes)])
+    attributes = _concatenate_attributes(meshes)
+    return MeshArrays(
+        positions=_np.concatenate(
+            [mesh.positions for mesh in meshes] or [_np.empty((0, 3))]
+        ),
+        loop_vertices=_np.concatenate(
+            [
+                mesh.loop_vertices + offset
+                for mesh, offset in zip(meshes, vertex_offsets)
+            ]
+            or [_np.empty(0, dtype=_np.int64)]
+        ),
+        face_sizes=_np.concatenate(
+            [mesh.face_sizes for mesh in meshes] or [_np.empty(0, dtype=_np.int64)]
+        ),
+        face_materials=_np.concatenate(
+            [mesh.face_materials for mesh in meshes] or [_np.empty(0, dtype=_np.int64)]
+        ),
+        face_smooth=_np.concatenate(
+            [mesh.face_smooth for mesh in meshes] or [_np.empty(0, dtype=_np.bool_)]
+        ),
+        attributes=attributes,
+        # unless the name is another kind of attribute in the first mesh with it
+        uv_maps=tuple(
+            name
+            for name in dict.fromkeys(name for mesh in meshes for name in mesh.uv_maps)
+            if attributes[name].domain == "CORNER"
+            and attributes[name].data_type == "FLOAT2"
+        ),
+        active_uv_map=next(
+            (mesh.active_uv_map for mesh in meshes if mesh.active_uv_map), None
+        ),
+    )
+
+
+def face_centers(mesh: MeshArrays) -> _NDArray[_np.float64]:
+    # the mean of the vertices, like 'MeshPolygon.center'
+    if not len(mesh.face_sizes):
+        return _np.empty((0, 3))
+    return (
+        _np.add.reduceat(mesh.positions[mesh.loop_vertices], mesh.face_starts)
+        / mesh.face_sizes[:, None]
+    )
+
+
+def _remove_unused_vertices(mesh: MeshArrays) -> MeshArrays:
+    used = _np.zeros(len(mesh.positions), dtype=_np.bool_)
+    used[mesh.loop_vertices] = True
+    indices = used.cumsum() - 1
+    return _replace(
+        mesh,
+        positions=mesh.positions[used],
+        loop_vertices=indices[mesh.loop_vertices],
+        attributes=_index_attributes(mesh.attributes, POINT=used),
+    )
+
+
+def remove_faces(mesh: MeshArrays, faces: _ArrayLike) -> MeshArrays:
+    # like deleting faces in edit mode, vertices only used by the faces are removed
+    keep = ~_np.asarray(faces, dtype=_np.bool_)
+    loops = _np.repeat(keep, mesh.face_sizes)
+    return _remove_unused_vertices(
+        _replace(
+            mesh,
+            loop_vertices=mesh.loop_vertices[loops],
+            face_sizes=mesh.face_sizes[keep],
+            face_materials=mesh.face_materials[keep],
+            face_smooth=mesh.face_smooth[keep],
+            attributes=_index_attributes(mesh.attributes, CORNER=loops, FACE=keep),
+        )
+    )
+
+
+def remove_degenerate_faces(mesh: MeshArrays) -> MeshArrays:
+    # removes loops repeating the vertex of the next loop in the same face,
+    # then faces left with less than 3 loops
+    if not len(mesh.face_sizes):
+        return mesh
+    face_starts = mesh.face_starts
+    next_loops = _np.arange(1, len(mesh.loop_vertices) + 1)
+    next_loops[face_starts + mesh.face_sizes - 1] = face_starts
+    loops = mesh.loop_vertices != mesh.loop_vertices[next_loops]
+    del next_loops
+    face_sizes = _np.add.reduceat(loops, face_starts).astype(_np.int64)
+    faces = face_sizes >= 3
+    loops &= _np.repeat(faces, mesh.face_sizes)
+    return _remove_unused_vertices(
+        _replace(
+            mesh,
+            loop_vertices=mesh.loop_vertices[loops],
+            face_sizes=face_sizes[faces],
+            face_materials=mesh.face_materials[faces],
+            face_smooth=mesh.face_smooth[faces],
+            attributes=_index_attributes(mesh.attributes, CORNER=loops, FACE=faces),
+        )
+    )
+
+
+def merge_vertices(mesh: MeshArrays, distance: float) -> MeshArrays:
+    # like merging vertices by distance, keeping the lowest index of each group,
+    # with its point attributes
+    labels = weld_vertices(mesh.positions, distance)
+    return remove_degenerate_faces(
+        _replace(mesh, loop_vertices=labels[mesh.loop_vertices])
+    )
+
+
+def write_mesh(mesh: _Mesh, arrays: MeshArrays):
+    # 'mesh' should be empty, and its edges are calculated from the faces
+    vertices, loops, polygons = mesh.vertices, mesh.loops, mesh.polygons
+    vertices.add(len(arrays.positions))
+    vertices.foreach_set("co", arrays.positions.astype(_np.float32).ravel())
+    loops.add(len(arrays.loop_vertices))
+    loops.foreach_set("vertex_index", arrays.loop_vertices.astype(_np.int32))
+    polygons.add(len(arrays.face_sizes))
+    polygons.foreach_set("loop_start", arrays.face_starts.astype(_np.int32))
+    # calculated from the starts since Blender 4.0
+    if not _MeshPolygon.bl_rna.properties["loop_total"].is_readonly:
+        polygons.foreach_set("loop_total", arrays.face_sizes.astype(_np.int32))
+    polygons.foreach_set("material_index", arrays.face_materials.astype(_np.int32))
+    polygons.foreach_set("use_smooth", arrays.face_smooth)
+    uv_layers = mesh.uv_layers
+    for name, attribute in arrays.attributes.items():
+        values = attribute.values.ravel()
+        # UV maps beyond the limit of Blender are kept as attributes
+        uv_layer = uv_layers.new(name=name) if name in arrays.uv_maps else None
+        if uv_layer is not None:
+            uv_layer.data.foreach_set("uv", values)
+        else:
+            mesh.attributes.new(
+                name, attribute.data_type, attribute.domain  # type: ignore
+            ).data.foreach_set(_ATTRIBUTE_TYPES[attribute.data_type][0], values)
+    if arrays.active_uv_map is not None:
+        uv_layer = uv_layers.get(arrays.active_uv_map)
+        if uv_layer is not None:
+            uv_layers.active = uv_layer
+            uv_layer.active_render = True
+    mesh.update(calc_edges=True)
+    # faces repeating vertices elsewhere or repeating other faces
+    mesh.validate()
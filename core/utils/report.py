@@ -0,0 +1,122 @@
+# -*- coding: bccelerator-transform-UTF-8 -*-
+from bpy.types import Context as _Ctx, Operator as _Op
+from enum import unique as _unique
+from os import environ as _environ
+from typing import Any as _Any, ClassVar as _ClassVar, final as _final
+
+from .enums import WMReport as _WMReport
+from .polyfill import StrEnum as _StrEnum
+from .types import count_profile_reports as _count_profile_reports
+
+# set to one of 'ReportVerbosity'
+REPORT_VERBOSITY_ENVIRON = "BCCELERATOR_REPORT_VERBOSITY"
+REPORT_TEXT_NAME = "bccelerator.log"
+# details of these types are reported regardless of the limit
+_WARNINGS = frozenset(
+    {
+        _WMReport.WARNING,
+        _WMReport.ERROR,
+        _WMReport.ERROR_INVALID_INPUT,
+        _WMReport.ERROR_INVALID_CONTEXT,
+        _WMReport.ERROR_OUT_OF_MEMORY,
+    }
+)
+
+
+@_final
+@_unique
+class ReportVerbosity(_StrEnum):
+    __slots__: _ClassVar = ()
+
+    SUMMARY: _ClassVar = "SUMMARY"
+    BRIEF: _ClassVar = "BRIEF"
+    FULL: _ClassVar = "FULL"
+
+
+def _verbosity():
+    try:
+        return ReportVerbosity(_environ.get(REPORT_VERBOSITY_ENVIRON, "").upper())
+    except ValueError:
+        return ReportVerbosity.BRIEF
+
+
+@_final
+class Reporter:
+    # 'SUMMARY' reports no details, 'BRIEF' reports every warning and the first few
+    # other details, and 'FULL' also writes every detail to the text 'REPORT_TEXT_NAME'
+    __slots__: _ClassVar = (
+        "__operator",
+        "__data",
+        "__limit",
+        "__verbosity",
+        "__shown",
+        "__limited",
+        "__omitted",
+        "__omitted_warnings",
+        "__lines",
+    )
+
+    def __init__(
+        self,
+        operator: _Op,
+        context: _Ctx,
+        *,
+        limit: int = 10,
+        verbosity: ReportVerbosity | None = None,
+    ):
+        self.__operator = operator
+        self.__data = context.blend_data
+        self.__limit = limit
+        self.__verbosity = _verbosity() if verbosity is None else verbosity
+        self.__shown = 0
+        self.__limited = 0
+        self.__omitted = 0
+        self.__omitted_warnings = 0
+        self.__lines = list[str]()
+
+    def detail(self, type: _WMReport, format: str, /, *args: _Any):
+        # 'format' is only formatted if the message is kept
+        warning = type in _WARNINGS
+        if self.__verbosity == ReportVerbosity.SUMMARY:
+            self.__omitted += 1
+            self.__omitted_warnings += warning
+            return
+        message = None
+        if warning or self.__limited < self.__limit:
+            message = format.format(*args)
+            self.__operator.report({type}, message)
+            self.__shown += 1
+            self.__limited += not warning
+        else:
+            self.__omitted += 1
+        if self.__verbosity == ReportVerbosity.FULL:
+            self.__lines.append(
+                f"{type}: {format.format(*args) if message is None else message}"
+            )
+
+    def summary(self, type: _WMReport, message: str):
+        # every message, whether reported or omitted, and the summary
+        _count_profile_reports(self.__shown + self.__omitted + 1)
+        if self.__lines:
+            texts = self.__data.texts
+            text = texts.get(REPORT_TEXT_NAME) or texts.new(REPORT_TEXT_NAME)
+            text.cursor_set(len(text.lines) - 1, character=len(text.lines[-1].body))
+            text.write(
+                "".join(
+                    f"{line}\n"
+                    for line in (f"{self.__operator.bl_idname}:", *self.__lines)
+                )
+            )
+            self.__lines.clear()
+        if self.__omitted:
+            omitted = f"Omitted {self.__omitted} message(s)"
+            if self.__omitted_warnings:
+                omitted += f", including {self.__omitted_warnings} warning(s)"
+            if self.__verbosity == ReportVerbosity.FULL:
+                omitted += f', see text "{REPORT_TEXT_NAME}"'
+            self.__operator.report(
+                {_WMReport.WARNING if self.__omitted_warnings else _WMReport.INFO},
+                omitted,
+            )
+            self.__omitted = self.__omitted_warnings = 0
+        self.__operator.report({type}, message)
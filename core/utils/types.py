@@ -1,11 +1,23 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
 from bpy import types as _types
-from bpy.types import Context as _Ctx, UILayout as _UILayout
+from bpy.types import (
+    Context as _Ctx,
+    Event as _Evt,
+    Operator as _Op,
+    UILayout as _UILayout,
+)
+from collections import deque as _deque
+from contextlib import contextmanager as _contextmanager
+from dataclasses import dataclass as _dataclass
 from functools import wraps as _wraps
+from os import environ as _environ
+from time import perf_counter as _perf_counter
 from typing import (
+    Any as _Any,
     Callable as _Callable,
     Protocol as _Protocol,
     TypeVar as _TypeVar,
+    cast as _cast,
     final as _final,
 )
 
@@ -14,6 +26,11 @@ from .enums import OperatorTypeFlag as _OpTypeFlag
 
 _T = _TypeVar("_T")
 
+# set to the number of samples to keep, or any other non-empty value for the default,
+# to enable profiling from the start of the session
+PROFILE_ENVIRON = "BCCELERATOR_PROFILE"
+_PROFILE_DEFAULT_MAXLEN = 65536
+
 
 @_final
 class Drawer(_Protocol):
@@ -75,3 +92,118 @@ def internal_operator(*, uuid: str):
         return cls
 
     return decorator
+
+
+@_final
+@_dataclass(
+    init=True,
+    repr=True,
+    eq=True,
+    order=False,
+    unsafe_hash=False,
+    frozen=True,
+    match_args=True,
+    kw_only=True,
+    slots=True,
+)
+class ProfileSample:
+    operator: str
+    method: str
+    start: float
+    duration: float
+    reports: int
+
+
+def _initial_profile_samples() -> _deque[ProfileSample] | None:
+    maxlen = _environ.get(PROFILE_ENVIRON, "")
+    if not maxlen:
+        return None
+    return _deque(maxlen=int(maxlen) if maxlen.isdigit() else _PROFILE_DEFAULT_MAXLEN)
+
+
+# samples of this session, or None if profiling is disabled
+_samples = [_initial_profile_samples()]
+_profiled = set[type]()
+_reports = [0]
+
+
+def profile_samples() -> _deque[ProfileSample] | None:
+    return _samples[0]
+
+
+def set_profiling(enabled: bool, *, maxlen: int = _PROFILE_DEFAULT_MAXLEN):
+    # keeps the collected samples if profiling is already enabled
+    if not enabled:
+        _samples[0] = None
+    elif _samples[0] is None:
+        _samples[0] = _deque(maxlen=maxlen)
+
+
+def count_profile_reports(count: int = 1):
+    _reports[0] += count
+
+
+@_contextmanager
+def _profiling(idname: str, method: str):
+    # only entered while profiling is enabled
+    samples = _cast(_deque[ProfileSample], _samples[0])
+    reports = _reports[0]
+    start = _perf_counter()
+    try:
+        yield
+    finally:
+        samples.append(
+            ProfileSample(
+                operator=idname,
+                method=method,
+                start=start,
+                duration=_perf_counter() - start,
+                reports=_reports[0] - reports,
+            )
+        )
+
+
+def profiled_operator(cls: type[_T]) -> type[_T]:
+    # Blender checks the number of arguments of these methods on registration,
+    # so the wrappers have the same signatures, and skip timing unless profiling
+    if cls in _profiled or not issubclass(cls, _Op):
+        return cls
+    _profiled.add(cls)
+    idname: str = getattr(cls, "bl_idname")
+
+    execute_0 = cls.__dict__.get("execute")
+    if execute_0 is not None:
+
+        @_wraps(execute_0)
+        def execute(self: _Op, context: _Ctx):
+            if _samples[0] is None:
+                return execute_0(self, context)
+            with _profiling(idname, "execute"):
+                return execute_0(self, context)
+
+        setattr(cls, "execute", execute)
+    invoke_0 = cls.__dict__.get("invoke")
+    if invoke_0 is not None:
+
+        @_wraps(invoke_0)
+        def invoke(self: _Op, context: _Ctx, event: _Evt):
+            if _samples[0] is None:
+                return invoke_0(self, context, event)
+            with _profiling(idname, "invoke"):
+                return invoke_0(self, context, event)
+
+        setattr(cls, "invoke", invoke)
+    poll_0 = cls.__dict__.get("poll")
+    if isinstance(poll_0, classmethod):
+        poll_func: _Callable[[type, _Ctx], bool] = poll_0.__func__
+
+        @classmethod
+        @_wraps(poll_func)
+        def poll(cls: type[_Op], context: _Ctx):
+            if _samples[0] is None:
+                return poll_func(cls, context)
+            with _profiling(idname, "poll"):
+                return poll_func(cls, context)
+
+        setattr(cls, "poll", poll)
+    return cls
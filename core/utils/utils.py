@@ -4,6 +4,7 @@ from bpy.types import (
     bpy_struct as _bpy_struct,
     AnimData as _AnimData,
     Driver as _Driver,
+    FCurve as _FCurve,
     ID as _ID,
     Operator as _Op,
 )
@@ -12,14 +13,25 @@ from bpy.utils import (
     unregister_class as _unreg_class,  # type: ignore
 )
 from functools import partial as _partial
-from typing import Callable as _Callable, Iterable as _Iter, Sequence as _Seq
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    ClassVar as _ClassVar,
+    Collection as _Collect,
+    Iterable as _Iter,
+    Sequence as _Seq,
+    cast as _cast,
+    final as _final,
+)
 
 from .enums import (
     Driver as _EDriver,
     DriverVariable as _EDriverVariable,
     IDType as _IDType,
 )
-from . import clear as _clear
+from .types import profiled_operator as _profiled_op
+
+_DRIVABLE_TYPES = frozenset({"BOOLEAN", "INT", "FLOAT", "ENUM"})
 
 
 def configure_driver(
@@ -31,32 +43,216 @@ def configure_driver(
     var_name: str = "var",
     expr: str | None = None
 ):
-    driver.expression = var_name if expr is None else expr
-    driver.type = _EDriver.Type.AVERAGE if expr is None else _EDriver.Type.SCRIPTED
-    driver.use_self = False if expr is None else "self" in expr
+    # only assigns what differs, and returns whether anything is assigned,
+    # as assignments rebuild the depsgraph relations
+    changed = False
+    expression = var_name if expr is None else expr
+    type = _EDriver.Type.AVERAGE if expr is None else _EDriver.Type.SCRIPTED
+    use_self = False if expr is None else "self" in expr
+    if driver.type != type:
+        driver.type, changed = type, True
+    if driver.expression != expression:
+        driver.expression, changed = expression, True
+    if driver.use_self != use_self:
+        driver.use_self, changed = use_self, True
 
+    # reuse a variable, preferably one with the same name, and remove the others
     variables = driver.variables
-    _clear(variables)
+    variable = variables.get(var_name) or next(iter(variables), None)
+    for other in tuple(variables):
+        if other != variable:
+            variables.remove(other)
+            changed = True
+    if variable is None:
+        variable, changed = variables.new(), True
+    if variable.name != var_name:
+        variable.name, changed = var_name, True
+    if variable.type != _EDriverVariable.Type.SINGLE_PROP:
+        variable.type, changed = _EDriverVariable.Type.SINGLE_PROP, True
+
+    target = variable.targets[0]
+    if target.id_type != id_type:
+        target.id_type, changed = id_type, True
+    if target.id != id:
+        target.id, changed = id, True
+    if target.data_path != data_path:
+        target.data_path, changed = data_path, True
+    return changed
 
-    variable = variables.new()
-    variable.name = var_name
-    variable.type = _EDriverVariable.Type.SINGLE_PROP
 
+def is_link_driver(driver: _Driver, *, id_type: _IDType):
+    # whether 'driver' has the shape configured by 'configure_driver', at most one
+    # variable reading a single property of an ID of 'id_type', or else is likely
+    # hand-written and should not be reconfigured
+    variables = driver.variables
+    if not variables:
+        return True
+    if len(variables) != 1:
+        return False
+    variable = variables[0]
+    if variable.type != _EDriverVariable.Type.SINGLE_PROP:
+        return False
     target = variable.targets[0]
-    target.id_type = id_type
-    target.id = id
-    target.data_path = data_path
+    return target.id is None or target.id_type == id_type
+
+
+def configure_drivers(
+    curves: _FCurve | _Collect[_FCurve],
+    *,
+    id_type: _IDType,
+    id: _ID,
+    data_path: str,
+    var_name: str = "var",
+    expr: str | None = None,
+):
+    # configures a driver or, for an array property, the drivers of all indices,
+    # each reading the same index of 'data_path', and returns the number changed
+    if not isinstance(curves, _Collect):
+        return int(
+            configure_driver(
+                curves.driver,
+                id_type=id_type,
+                id=id,
+                data_path=data_path,
+                var_name=var_name,
+                expr=expr,
+            )
+        )
+    return sum(
+        configure_driver(
+            curve.driver,
+            id_type=id_type,
+            id=id,
+            data_path=f"{data_path}[{curve.array_index}]",
+            var_name=var_name,
+            expr=expr,
+        )
+        for curve in curves
+    )
 
 
-def has_driver(id: _ID, data_path: str):
+@_final
+class DriverIndex:
+    # driver data paths and array indices by ID pointer, built lazily per ID
+    __slots__: _ClassVar = ("__paths",)
+
+    def __init__(self):
+        self.__paths = dict[int, dict[str, set[int]]]()
+
+    def __paths_of(self, id: _ID):
+        key = id.as_pointer()
+        try:
+            return self.__paths[key]
+        except KeyError:
+            pass
+        paths = dict[str, set[int]]()
+        animd: _AnimData | None = getattr(id, "animation_data", None)
+        if animd is not None:
+            for driver in animd.drivers:
+                try:
+                    paths[driver.data_path].add(driver.array_index)
+                except KeyError:
+                    paths[driver.data_path] = {driver.array_index}
+        self.__paths[key] = paths
+        return paths
+
+    def has(self, id: _ID, data_path: str, array_index: int | None = None):
+        indices = self.__paths_of(id).get(data_path)
+        if indices is None:
+            return False
+        return array_index is None or array_index in indices
+
+    def driver_add(self, id: _ID, data_path: str, index: int = -1) -> _Any:
+        paths = self.__paths_of(id)
+        curves = id.driver_add(data_path, index)
+        for curve in curves if isinstance(curves, _Collect) else (curves,):
+            try:
+                paths[curve.data_path].add(curve.array_index)
+            except KeyError:
+                paths[curve.data_path] = {curve.array_index}
+        return curves
+
+    def driver_ensure(
+        self, id: _ID, data_path: str, *, id_type: _IDType | None = None
+    ) -> _Any:
+        # the existing driver(s) of 'data_path', as 'driver_add' would reset their type
+        # and expression, with new ones for the missing array indices, or else new
+        # one(s), and with 'id_type', None if any existing one is not a link from it
+        indices = self.__paths_of(id).get(data_path)
+        if not indices:
+            return self.driver_add(id, data_path)
+        drivers = _cast(_AnimData, id.animation_data).drivers
+        value = id.path_resolve(data_path)
+        if isinstance(value, str) or not hasattr(value, "__len__"):
+            curve = drivers.find(data_path)
+            if id_type is not None and not is_link_driver(
+                curve.driver, id_type=id_type
+            ):
+                return None
+            return curve
+        curves = [drivers.find(data_path, index=index) for index in sorted(indices)]
+        if id_type is not None and not all(
+            is_link_driver(curve.driver, id_type=id_type) for curve in curves
+        ):
+            return None
+        for index in range(len(value)):
+            if index not in indices:
+                curves.append(self.driver_add(id, data_path, index))
+        curves.sort(key=lambda curve: curve.array_index)
+        return curves
+
+
+def configure_drivers_bulk(
+    to_id: _ID,
+    data_paths: _Iter[str],
+    *,
+    id_type: _IDType,
+    id: _ID,
+    drivers: DriverIndex | None = None,
+) -> tuple[list[_FCurve], list[str]]:
+    # drives each data path of 'to_id' by the same data path of 'id', reconfiguring
+    # existing link drivers, and returns the drivers of the data paths changed and
+    # the data paths skipped for having other drivers
+    if drivers is None:
+        drivers = DriverIndex()
+    ret = list[_FCurve]()
+    skipped = list[str]()
+    for data_path in data_paths:
+        curves = drivers.driver_ensure(to_id, data_path, id_type=id_type)
+        if curves is None:
+            skipped.append(data_path)
+        elif configure_drivers(curves, id_type=id_type, id=id, data_path=data_path):
+            if isinstance(curves, _Collect):
+                ret.extend(curves)
+            else:
+                ret.append(curves)
+    return ret, skipped
+
+
+def drivable_properties(struct: _bpy_struct) -> tuple[str, ...]:
+    return tuple(
+        prop.identifier
+        for prop in struct.bl_rna.properties
+        if prop.is_animatable
+        and not prop.is_readonly
+        and prop.type in _DRIVABLE_TYPES
+        and not getattr(prop, "is_enum_flag", False)
+    )
+
+
+def has_driver(id: _ID, data_path: str, array_index: int | None = None):
     animd: _AnimData | None = getattr(id, "animation_data", None)
     if animd is None:
         return False
-    return any(driver.data_path == data_path for driver in animd.drivers)
+    return any(
+        driver.data_path == data_path
+        and (array_index is None or driver.array_index == array_index)
+        for driver in animd.drivers
+    )
 
 
 def register_class(cls: type):
-    _reg_class(cls)
+    _reg_class(_profiled_op(cls))
 
 
 def unregister_class(cls: type[_bpy_struct]):
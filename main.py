@@ -1,14 +1,39 @@
 # -*- coding: bccelerator-transform-UTF-8 -*-
+from bpy import app as _app
+from bpy.app import timers as _app_timers
+from os import environ as _environ
+from types import ModuleType as _ModuleType
+
 from .core.tools import items as _items
 
-_modules = tuple(_items())
+# set to a non-empty value to load tool modules after Blender has started instead
+# of while enabling the add-on, ignored in background mode where scripts may use the
+# operators right away
+LAZY_REGISTER_ENVIRON = "BCCELERATOR_LAZY_REGISTER"
+
+_modules = list[_ModuleType]()
+
+
+def _register_all():
+    for module in _items():
+        if module not in _modules:
+            module.register()
+            _modules.append(module)
+    # run once
+    return None
 
 
 def register():
-    for module in _modules:
-        module.register()
+    if _environ.get(LAZY_REGISTER_ENVIRON) and not _app.background:
+        # timers first run once the event loop has started and the startup file loaded
+        _app_timers.register(_register_all, first_interval=0, persistent=True)
+    else:
+        _register_all()
 
 
 def unregister():
+    if _app_timers.is_registered(_register_all):
+        _app_timers.unregister(_register_all)
     for module in reversed(_modules):
         module.unregister()
+    _modules.clear()